@@ -0,0 +1,198 @@
+import os
+import sys
+import json
+import argparse
+import pandas as pd
+from datetime import datetime, date
+
+from postings import SOURCES as POSTING_SOURCES
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+SNAPSHOT_FILE = "analytics_snapshot.json"   # 누적 집계 상태 (증분 갱신용)
+PUBLISH_FILE = "analytics.json"             # 대시보드용 요약 JSON
+
+# 사이트별 CSV 구조: (파일명, URL 컬럼, 등록일 컬럼, 기업명 컬럼, 기본 기업명)
+SOURCES = {
+    site: (src["filename"], src["columns"]["url"], src["columns"]["first_seen"], src["columns"].get("company"), src["default_company"])
+    for site, src in POSTING_SOURCES.items()
+}
+
+# =========================================================
+# 2. 스냅샷 입출력
+# =========================================================
+
+def _empty_stats():
+    # open: 현재 게시중, delta: {날짜: 게시중 수 증감} (추이는 읽을 때 누적), weekly: {ISO주차: 신규 수},
+    # lifetimes: {게시일수: 건수}, closed/reopened: 누적 마감/재오픈 수
+    return {"open": 0, "delta": {}, "weekly": {}, "lifetimes": {}, "closed": 0, "reopened": 0}
+
+def _history_to_delta(history):
+    """예전 스냅샷의 {날짜: 게시중 수} 를 {날짜: 증감} 으로 변환"""
+    delta, prev = {}, 0
+    for day in sorted(history):
+        delta[day] = history[day] - prev
+        prev = history[day]
+    return delta
+
+def load_snapshot(path=SNAPSHOT_FILE):
+    """스냅샷 로드 (없으면 빈 상태)"""
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        for stats in snapshot["stats"].values():
+            if "history" in stats:
+                stats["delta"] = _history_to_delta(stats.pop("history"))
+        return snapshot
+    return {"postings": {}, "stats": {}}
+
+def save_snapshot(snapshot, path=SNAPSHOT_FILE):
+    """스냅샷을 공백 없는 JSON으로 저장"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+# =========================================================
+# 3. 이벤트 반영 (신규 / 마감 / 재오픈)
+# =========================================================
+
+def _clean_date(value):
+    value = "" if pd.isna(value) else str(value).strip()
+    return "" if value in ("", "-", "nan") else value[:10]
+
+def _iso_week(day):
+    year, week, _ = date.fromisoformat(day).isocalendar()
+    return f"{year}-W{week:02d}"
+
+def _stats(snapshot, key):
+    return snapshot["stats"].setdefault(key, _empty_stats())
+
+def _apply_event(snapshot, key, kind, day, first_seen=""):
+    stats = _stats(snapshot, key)
+    before = stats["open"]
+    if kind == "new":
+        stats["open"] += 1
+        if first_seen:
+            week = _iso_week(first_seen)
+            stats["weekly"][week] = stats["weekly"].get(week, 0) + 1
+    elif kind == "close":
+        stats["open"] -= 1
+        stats["closed"] += 1
+        if first_seen:
+            days = str(max((date.fromisoformat(day) - date.fromisoformat(first_seen)).days, 0))
+            stats["lifetimes"][days] = stats["lifetimes"].get(days, 0) + 1
+    elif kind == "reopen":
+        stats["open"] += 1
+        stats["reopened"] += 1
+    # 증감만 그 날짜에 기록하므로, 지난 날짜의 이벤트가 늦게 들어와도 이후 날짜의 추이가 함께 맞춰짐
+    stats["delta"][day] = stats["delta"].get(day, 0) + stats["open"] - before
+
+def open_history(stats):
+    """날짜별 증감을 누적한 게시중 수 추이 [(날짜, 게시중 수), ...]"""
+    history, total = [], 0
+    for day in sorted(stats["delta"]):
+        total += stats["delta"][day]
+        history.append((day, total))
+    return history
+
+def update_from_frame(snapshot, site, df, today=None):
+    """한 사이트의 현재 DataFrame을 스냅샷과 비교해 바뀐 행만 집계에 반영합니다."""
+    today = today or datetime.now().strftime("%Y-%m-%d")
+    _, url_col, seen_col, company_col, default_company = SOURCES[site]
+    postings = snapshot["postings"]
+
+    urls = df[url_col].astype(str)
+    completed = df["completed_date"].map(_clean_date)
+    prev = urls.map(lambda u: postings.get(u))
+    prev_completed = prev.map(lambda p: p[3] if p else None)
+
+    # 신규 URL 이거나 마감 상태가 바뀐 행만 골라냄 (증분 처리)
+    changed = prev.isna() | (prev_completed != completed)
+    if not changed.any():
+        return 0
+
+    events = []
+    for idx in df.index[changed]:
+        url = urls[idx]
+        company = default_company
+        if company_col:
+            company = str(df.at[idx, company_col]).strip()
+            if company in ("", "nan"):
+                company = default_company
+        key = f"{site}|{company}"
+        first_seen = _clean_date(df.at[idx, seen_col]) or today
+        done = completed[idx]
+
+        if prev[idx] is None:
+            events.append((first_seen, key, "new", first_seen))
+            if done:
+                events.append((done, key, "close", first_seen))
+        elif done and not prev[idx][3]:
+            events.append((done, key, "close", prev[idx][2]))
+        elif not done:
+            events.append((today, key, "reopen", prev[idx][2]))
+        postings[url] = [site, company, prev[idx][2] if prev[idx] else first_seen, done]
+
+    # 같은 실행 안에서는 날짜순으로 반영 (추이는 날짜별 증감이라 이전 실행보다 과거 날짜여도 됨)
+    for day, key, kind, first_seen in sorted(events):
+        _apply_event(snapshot, key, kind, day, first_seen)
+    return len(events)
+
+# =========================================================
+# 4. 대시보드용 요약
+# =========================================================
+
+def _median_from_hist(hist):
+    total = sum(hist.values())
+    if not total:
+        return None
+    seen = 0
+    for days in sorted(hist, key=int):
+        seen += hist[days]
+        if seen * 2 >= total:
+            return int(days)
+
+def publish(snapshot, path=PUBLISH_FILE):
+    """회사×사이트별 요약 JSON 저장 (게시중 추이, 주간 신규, 게시기간 중앙값, 재오픈률)"""
+    rows = []
+    for key, stats in sorted(snapshot["stats"].items()):
+        site, company = key.split("|", 1)
+        rows.append({
+            "site": site,
+            "company": company,
+            "open": stats["open"],
+            "open_history": open_history(stats),
+            "weekly_new": sorted(stats["weekly"].items()),
+            "median_lifetime_days": _median_from_hist(stats["lifetimes"]),
+            "reopen_rate": round(stats["reopened"] / stats["closed"], 3) if stats["closed"] else 0.0,
+        })
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"updated": datetime.now().strftime("%Y-%m-%d %H:%M"), "stats": rows}, f, ensure_ascii=False, separators=(",", ":"))
+
+def record_run(site, df, today=None):
+    """스크래퍼 저장 직후 호출: 이번 실행의 변경분만 집계에 반영하고 JSON 발행"""
+    snapshot = load_snapshot()
+    changes = update_from_frame(snapshot, site, df, today)
+    if changes:
+        save_snapshot(snapshot)
+        publish(snapshot)
+    print(f"[통계] {site} 변경 {changes}건 반영")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="채용 통계 스냅샷을 CSV로부터 (재)구성합니다.")
+    parser.add_argument("--rebuild", action="store_true", help="기존 스냅샷을 버리고 전체 이력으로 다시 계산")
+    args = parser.parse_args(argv)
+
+    snapshot = {"postings": {}, "stats": {}} if args.rebuild else load_snapshot()
+    for site, (file_name, *_) in SOURCES.items():
+        if not os.path.exists(file_name):
+            print(f"[Skip] 파일 없음: {file_name}")
+            continue
+        changes = update_from_frame(snapshot, site, pd.read_csv(file_name, encoding="utf-8-sig"))
+        print(f"[{site}] 변경 {changes}건 반영")
+    save_snapshot(snapshot)
+    publish(snapshot)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
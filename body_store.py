@@ -0,0 +1,147 @@
+import os
+import sys
+import gzip
+import json
+import hashlib
+import argparse
+import pandas as pd
+
+from section_parser import SECTION_COLUMNS, parse_sections
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+# 본문 원문은 해시 기반 압축 파일로 저장하고 CSV에는 해시와 미리보기만 남깁니다.
+# 본문에서 나눈 섹션(주요업무 등)도 CSV가 아니라 같은 해시의 옆 파일(<h>.sections.gz)에 둡니다.
+STORE_DIR = "bodies"
+BODY_COL = "공고문 컬럼"      # CSV 에는 미리보기만 남는 컬럼
+HASH_COL = "본문 해시"
+PREVIEW_LEN = 200
+HASH_LEN = 20
+
+BODY_FILES = ["saramin_results.csv", "wanted_results.csv", "remember_results.csv"]
+
+# =========================================================
+# 2. 저장소 입출력
+# =========================================================
+
+def body_hash(text):
+    """본문 텍스트의 내용 해시 (sha256 앞부분)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:HASH_LEN]
+
+def blob_path(h, store_dir=STORE_DIR):
+    return os.path.join(store_dir, h[:2], f"{h}.gz")
+
+def sections_path(h, store_dir=STORE_DIR):
+    return os.path.join(store_dir, h[:2], f"{h}.sections.gz")
+
+def _write_blob(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # mtime=0 으로 고정해 같은 내용은 항상 같은 바이트가 되도록 함
+    with open(path, "wb") as f:
+        f.write(gzip.compress(text.encode("utf-8"), mtime=0))
+
+def put_sections(h, sections, store_dir=STORE_DIR):
+    """본문 해시 옆에 섹션 dict 를 JSON 으로 저장합니다."""
+    _write_blob(sections_path(h, store_dir), json.dumps(sections, ensure_ascii=False, sort_keys=True))
+
+def put_body(text, store_dir=STORE_DIR):
+    """본문(과 그 섹션)을 저장소에 넣고 해시를 반환합니다 (같은 내용은 한 번만 저장)."""
+    h = body_hash(text)
+    if not os.path.exists(blob_path(h, store_dir)):
+        _write_blob(blob_path(h, store_dir), text)
+    if not os.path.exists(sections_path(h, store_dir)):
+        put_sections(h, parse_sections(text), store_dir)
+    return h
+
+def get_body(h, store_dir=STORE_DIR):
+    """해시로 본문을 읽어옵니다 (없으면 빈 문자열)."""
+    if not isinstance(h, str) or not h:
+        return ""
+    path = blob_path(h, store_dir)
+    if not os.path.exists(path):
+        return ""
+    with open(path, "rb") as f:
+        return gzip.decompress(f.read()).decode("utf-8")
+
+def get_sections(h, store_dir=STORE_DIR):
+    """해시로 섹션 dict 를 읽어옵니다 (옆 파일이 없으면 본문에서 다시 나눔)."""
+    path = sections_path(h, store_dir) if isinstance(h, str) and h else ""
+    if path and os.path.exists(path):
+        with open(path, "rb") as f:
+            sections = json.loads(gzip.decompress(f.read()).decode("utf-8"))
+        return {col: sections.get(col, "") for col in SECTION_COLUMNS}
+    return parse_sections(get_body(h, store_dir))
+
+# =========================================================
+# 3. DataFrame 변환
+# =========================================================
+
+def new_bodies(df):
+    """아직 저장소로 옮기지 않은 원문 본문(해시가 없거나 미리보기보다 긴 본문)인 행의 마스크"""
+    if HASH_COL not in df.columns:
+        df[HASH_COL] = ""
+    text = df[BODY_COL].fillna("").astype(str)
+    hashes = df[HASH_COL].fillna("").astype(str)
+    return (text.str.len() > PREVIEW_LEN) | ((hashes == "") & (text != ""))
+
+def store_bodies(df, store_dir=STORE_DIR):
+    """저장 직전 호출: 원문 본문을 저장소로 옮기고 해시/미리보기만 남깁니다.
+
+    new_bodies() 에 해당하는 행(새로 수집된 원문)만 처리합니다.
+    """
+    pending = new_bodies(df)
+    text = df[BODY_COL].fillna("").astype(str)
+
+    for idx in df.index[pending]:
+        df.at[idx, HASH_COL] = put_body(text[idx], store_dir)
+    df.loc[pending, BODY_COL] = text[pending].str[:PREVIEW_LEN]
+    return df
+
+def load_bodies(df, store_dir=STORE_DIR):
+    """해시 컬럼을 원문 본문으로 풀어 BODY_COL 을 채운 사본을 반환합니다."""
+    df = df.copy()
+    if HASH_COL not in df.columns:
+        return df
+    hashes = df[HASH_COL].fillna("").astype(str)
+    has_hash = hashes != ""
+    df.loc[has_hash, BODY_COL] = hashes[has_hash].map(lambda h: get_body(h, store_dir))
+    return df
+
+def load_sections(df, store_dir=STORE_DIR):
+    """해시 컬럼으로 저장소의 섹션을 읽어 섹션 컬럼을 붙인 사본을 반환합니다 (CSV 에는 저장하지 않음)."""
+    df = df.copy()
+    hashes = df[HASH_COL].fillna("").astype(str) if HASH_COL in df.columns else pd.Series("", index=df.index)
+    parsed = [get_sections(h, store_dir) for h in hashes.tolist()]
+    for col in SECTION_COLUMNS:
+        df[col] = [p[col] for p in parsed]
+    return df
+
+# =========================================================
+# 4. 마이그레이션 (기존 인라인 본문 → 저장소)
+# =========================================================
+
+def migrate_csv(file_name, store_dir=STORE_DIR):
+    df = pd.read_csv(file_name, encoding="utf-8-sig")
+    before = os.path.getsize(file_name)
+    # 섹션 컬럼은 CSV 에 두지 않음: 원문에서 나눈 섹션은 store_bodies() 가 본문 옆 파일로 저장
+    df = df.drop(columns=[c for c in SECTION_COLUMNS if c in df.columns])
+    df = store_bodies(df, store_dir)
+    df.to_csv(file_name, index=False, encoding="utf-8-sig")
+    print(f"[{file_name}] {before / 1024:.0f}KB → {os.path.getsize(file_name) / 1024:.0f}KB")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSV의 인라인 본문을 해시 기반 저장소로 옮깁니다.")
+    parser.add_argument("files", nargs="*", default=BODY_FILES)
+    parser.add_argument("--store", default=STORE_DIR)
+    args = parser.parse_args(argv)
+
+    for file_name in args.files:
+        if not os.path.exists(file_name):
+            print(f"[Skip] 파일 없음: {file_name}")
+            continue
+        migrate_csv(file_name, args.store)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,103 @@
+import os
+import pandas as pd
+from datetime import date
+
+from body_store import store_bodies
+from experience import EXPERIENCE_COLUMNS, add_experience_columns
+from relevance import RELEVANCE_COLUMNS
+from verify_closed import confirm_closed
+from analytics import record_run
+from scheduler import mark_crawled
+from retry_queue import forget
+
+# =========================================================
+# 1. 설정 (사람인/원티드/리멤버 공통 결과 CSV)
+# =========================================================
+
+COLUMNS = ["기업명", "공고명", "경력", "공고문 컬럼", "본문 해시", "이미지 링크", "URL", "first-seen", "completed_date"] + EXPERIENCE_COLUMNS + RELEVANCE_COLUMNS
+
+RESULT_FILES = {
+    "saramin": "saramin_results.csv",
+    "wanted": "wanted_results.csv",
+    "remember": "remember_results.csv",
+}
+
+# =========================================================
+# 2. 로드 / 병합 / 저장
+# =========================================================
+
+def load_results(site):
+    """기존 결과 CSV를 읽어 컬럼 구조를 맞춥니다 (없으면 빈 표)."""
+    csv_file = RESULT_FILES[site]
+    if not os.path.exists(csv_file):
+        return pd.DataFrame(columns=COLUMNS)
+    # 빈 컬럼이 float 로 읽히면 문자열을 넣을 수 없으므로 텍스트 컬럼은 object 로 읽음
+    df_old = pd.read_csv(csv_file, dtype={col: object for col in COLUMNS if col not in EXPERIENCE_COLUMNS})
+    # 컬럼 순서나 이름이 다를 경우를 대비해 재설정
+    for col in COLUMNS:
+        if col not in df_old.columns:
+            df_old[col] = ""
+    return df_old[COLUMNS]
+
+def has_body(df_old, link, min_len):
+    """이미 수집된 URL이고 본문이 min_len 자보다 길면 True"""
+    matched = df_old.loc[df_old['URL'] == link, '공고문 컬럼']
+    if matched.empty:
+        return False
+    content = matched.iloc[0]
+    return pd.notna(content) and str(content) != "nan" and len(str(content)) > min_len
+
+def upsert_rows(df_old, rows, today, reopen=True):
+    """수집한 공고(dict 목록)를 URL 기준으로 갱신/추가합니다.
+
+    reopen: 기존 공고를 다시 수집했을 때 마감일을 지우고 비어 있는 first-seen 을 채울지 여부
+    """
+    new_rows = {}
+    for row in rows:
+        link = row["URL"]
+        if link in df_old['URL'].values:
+            t_idx = df_old[df_old['URL'] == link].index[0]
+            df_old.at[t_idx, '경력'] = row["경력"]
+            df_old.at[t_idx, '공고문 컬럼'] = row["공고문 컬럼"]
+            df_old.at[t_idx, '본문 해시'] = "" # 저장 시 새 본문으로 다시 해시
+            df_old.at[t_idx, '이미지 링크'] = row["이미지 링크"]
+            if reopen:
+                if not df_old.at[t_idx, 'first-seen']:
+                    df_old.at[t_idx, 'first-seen'] = today
+                df_old.at[t_idx, 'completed_date'] = "" # 재오픈 시 마감일 제거
+        else:
+            new_rows[link] = {**row, "first-seen": today, "completed_date": ""}
+    if new_rows:
+        df_old = pd.concat([df_old, pd.DataFrame(list(new_rows.values()))], ignore_index=True)
+    return df_old
+
+def upsert_retried(df_old, rows, scraped_urls, today, reopen=True):
+    """재시도 큐에서 다시 수집한 공고를 반영합니다.
+
+    이번 검색에서 확인한 공고만 사이트 규칙(reopen)을 따르고, 이전 실행에서 실패해 남아 있던 공고는
+    그 사이 마감됐을 수 있으므로 마감일을 건드리지 않습니다.
+    """
+    seen = set(scraped_urls)
+    df_old = upsert_rows(df_old, [row for row in rows if row["URL"] in seen], today, reopen=reopen)
+    return upsert_rows(df_old, [row for row in rows if row["URL"] not in seen], today, reopen=False)
+
+def save_results(site, df_old, scraped_urls, companies, today, close_when_empty=True):
+    """마감 처리 후 CSV 저장, 분석 스냅샷/스케줄 갱신까지 마칩니다.
+
+    companies: 검색을 끝까지 마친 기업 (마감 처리와 스케줄 기록은 이 기업들만)
+    close_when_empty: 이번 실행에서 확인한 URL이 하나도 없어도 마감 처리를 할지 여부
+    """
+    if close_when_empty or len(scraped_urls) > 0:
+        mask = (~df_old['URL'].isin(scraped_urls)) & (df_old['completed_date'].isna() | (df_old['completed_date'] == "")) & (df_old['기업명'].isin(companies))
+        # 검색에서 빠진 공고는 상세 페이지로 마감 여부를 확인한 뒤에만 마감 처리
+        mask &= df_old['URL'].isin(confirm_closed(df_old.loc[mask, 'URL']))
+        df_old.loc[mask, 'completed_date'] = today
+        # 마감된 공고는 더 이상 상세 페이지를 재시도하지 않음
+        forget(df_old.loc[mask, 'URL'])
+
+    # 컬럼 순서 최종 고정 후 저장 (새 원문 본문과 그 섹션은 저장소로)
+    df_old = add_experience_columns(store_bodies(df_old[COLUMNS].copy()))
+    df_old.to_csv(RESULT_FILES[site], index=False, encoding="utf-8-sig")
+    record_run(site, df_old, today)
+    mark_crawled(site, companies, date.fromisoformat(today))
+    return df_old
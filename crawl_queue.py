@@ -0,0 +1,318 @@
+import os
+import sys
+import json
+import time
+import socket
+import sqlite3
+import argparse
+import importlib
+import subprocess
+from datetime import datetime
+
+from sites import target_companies
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+# 작업 큐 (여러 워커/러너가 같은 파일을 공유). WAL 은 공유 메모리 인덱스가 필요해 NFS 등 여러 호스트가
+# 함께 쓰는 파일시스템에서는 깨지므로, 기본 롤백 저널(DELETE)과 BEGIN IMMEDIATE 로 임대를 원자화합니다.
+QUEUE_FILE = "crawl_queue.db"
+
+# 작업 단위 = 사이트 × 기업 (검색 페이지는 scrape_company 가 끝까지 따라감). 사이트별 스크래퍼 모듈
+SITE_MODULES = {"saramin": "scraper", "wanted": "wanted", "remember": "remember"}
+
+LEASE_SECONDS = 600     # 마지막 임대 연장(상세 페이지 사이마다) 후 이 시간이 지나면 다른 워커가 다시 가져감
+MAX_ATTEMPTS = 3        # 이 횟수만큼 실패하거나 임대가 만료되면 failed 로 남김
+RETRY_DELAY = 60        # 실패 후 재시도까지 대기(초), 시도마다 2배
+POLL_SECONDS = 5        # 다른 워커가 잡고 있는 작업을 기다리는 간격
+
+# 작업 상태
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS units (
+    id INTEGER PRIMARY KEY,
+    run TEXT NOT NULL,
+    site TEXT NOT NULL,
+    company TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    not_before REAL NOT NULL DEFAULT 0,
+    lease_until REAL NOT NULL DEFAULT 0,
+    worker TEXT,
+    result TEXT,
+    error TEXT,
+    UNIQUE (run, site, company)
+)
+"""
+
+# 실행별 수집 날짜 (병합을 늦게/다시 해도 first-seen, completed_date 는 이 날짜로 기록)
+RUNS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run TEXT PRIMARY KEY,
+    day TEXT NOT NULL
+)
+"""
+
+# =========================================================
+# 2. 큐 (SQLite)
+# =========================================================
+
+def connect(path=QUEUE_FILE):
+    conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=DELETE")  # 이전 버전이 WAL 로 만든 파일도 되돌림
+    conn.execute(SCHEMA)
+    conn.execute(RUNS_SCHEMA)
+    return conn
+
+def today_run():
+    return datetime.now().strftime("%Y-%m-%d")
+
+def _run_date(run):
+    """날짜 형식의 run 이름이면 그 날짜, 아니면 None"""
+    try:
+        return datetime.strptime(run, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+def enqueue(conn, run, units, day=None):
+    """(site, company) 목록을 추가합니다. 이미 있는 작업은 건드리지 않으므로 여러 번 호출해도 안전합니다.
+
+    day: 이 실행의 수집 날짜 (기본: 날짜 형식의 run 이름, 아니면 오늘). 처음 enqueue 할 때의 값만 남습니다.
+    """
+    day = day or _run_date(run) or today_run()
+    conn.execute("INSERT OR IGNORE INTO runs (run, day) VALUES (?, ?)", (run, day))
+    before = conn.total_changes
+    conn.executemany(
+        "INSERT OR IGNORE INTO units (run, site, company) VALUES (?, ?, ?)",
+        [(run, site, company) for site, company in units],
+    )
+    return conn.total_changes - before
+
+def lease(conn, run, worker, lease_seconds=LEASE_SECONDS):
+    """대기 중이거나 임대가 만료된 작업 하나를 원자적으로 가져옵니다 (없으면 None).
+
+    워커가 죽어(Chrome OOM 등) 임대가 만료된 작업도 시도 횟수에 들어가며, MAX_ATTEMPTS 에 도달하면 failed 로 남깁니다.
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute(
+            "UPDATE units SET status = ?, error = ? WHERE run = ? AND status = ? AND lease_until < ? AND attempts >= ?",
+            (FAILED, f"임대 만료 {MAX_ATTEMPTS}회 (워커 비정상 종료)", run, LEASED, now, MAX_ATTEMPTS),
+        )
+        row = conn.execute(
+            "SELECT id, site, company, attempts FROM units WHERE run = ? AND "
+            "((status = ? AND not_before <= ?) OR (status = ? AND lease_until < ? AND attempts < ?)) ORDER BY attempts, id LIMIT 1",
+            (run, PENDING, now, LEASED, now, MAX_ATTEMPTS),
+        ).fetchone()
+        if row:
+            conn.execute(
+                "UPDATE units SET status = ?, worker = ?, lease_until = ?, attempts = attempts + 1 WHERE id = ?",
+                (LEASED, worker, now + lease_seconds, row[0]),
+            )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return row
+
+class LeaseLost(Exception):
+    """작업 임대가 만료돼 다른 워커에게 넘어갔거나 이미 끝난 경우"""
+
+def renew(conn, unit_id, worker, lease_seconds=LEASE_SECONDS):
+    """이 워커가 잡고 있는 작업의 임대를 연장합니다. 반환값: 아직 이 워커의 임대이면 True"""
+    cur = conn.execute(
+        "UPDATE units SET lease_until = ? WHERE id = ? AND status = ? AND worker = ?",
+        (time.time() + lease_seconds, unit_id, LEASED, worker),
+    )
+    return cur.rowcount == 1
+
+def complete(conn, unit_id, worker, rows, urls, searched=True):
+    """작업 결과를 기록합니다. 임대가 다른 워커로 넘어갔거나 이미 완료된 작업이면 무시합니다 (멱등).
+
+    searched: 검색을 끝까지 마쳤는지 여부 (False 면 병합 시 그 기업은 마감 처리하지 않음)
+    """
+    result = {"rows": rows, "urls": urls, "complete": searched}
+    cur = conn.execute(
+        "UPDATE units SET status = ?, result = ?, error = NULL WHERE id = ? AND status = ? AND worker = ?",
+        (DONE, json.dumps(result, ensure_ascii=False), unit_id, LEASED, worker),
+    )
+    return cur.rowcount == 1
+
+def fail(conn, unit_id, worker, error, attempts):
+    """실패를 기록하고, 재시도 횟수가 남았으면 지연 후 다시 대기 상태로 돌립니다."""
+    status = FAILED if attempts >= MAX_ATTEMPTS else PENDING
+    conn.execute(
+        "UPDATE units SET status = ?, error = ?, not_before = ?, lease_until = 0 WHERE id = ? AND status = ? AND worker = ?",
+        (status, str(error)[:500], time.time() + RETRY_DELAY * 2 ** (attempts - 1), unit_id, LEASED, worker),
+    )
+
+def run_day(conn, run):
+    """enqueue 때 기록한 실행 날짜 (기록이 없는 예전 큐는 날짜 형식의 run 이름을 그대로 사용)"""
+    row = conn.execute("SELECT day FROM runs WHERE run = ?", (run,)).fetchone()
+    day = row[0] if row else _run_date(run)
+    if day is None:
+        raise ValueError(f"실행 {run} 의 날짜 기록이 없습니다 (enqueue 로 만든 실행인지 확인)")
+    return day
+
+def remaining(conn, run):
+    """아직 끝나지 않은(대기/임대 중) 작업 수"""
+    return conn.execute("SELECT COUNT(*) FROM units WHERE run = ? AND status IN (?, ?)", (run, PENDING, LEASED)).fetchone()[0]
+
+def status_counts(conn, run):
+    return dict(conn.execute("SELECT status, COUNT(*) FROM units WHERE run = ? GROUP BY status", (run,)).fetchall())
+
+# =========================================================
+# 3. 워커 / 병합
+# =========================================================
+
+def plan_units(sites, companies=None):
+    """스케줄러가 고른 기업으로 오늘의 작업 단위를 만듭니다."""
+    from scheduler import plan_companies
+
+    units = []
+    for site in sites:
+        for company in plan_companies(site, companies or target_companies()):
+            units.append((site, company))
+    return units
+
+def scale_rates(workers):
+    """워커 수만큼 호스트별 요청 속도(시작값과 회복 상한/하한)를 나눠, 전체 속도가 단일 실행과 같도록 맞춥니다."""
+    from rate_limiter import limiter
+
+    limiter.host_rates = {host: rate / workers for host, rate in limiter.host_rates.items()}
+    limiter.default_rate /= workers
+    limiter.max_rate /= workers
+    limiter.min_rate /= workers
+
+def work(conn, run, worker, lease_seconds=LEASE_SECONDS):
+    """큐가 빌 때까지 작업을 가져와 처리합니다. 반환값: 완료한 작업 수"""
+    from competitor_csv import load_results
+    from session_health import BrowserSession
+
+    sessions, known, done = {}, {}, 0
+    try:
+        while True:
+            unit = lease(conn, run, worker, lease_seconds)
+            if unit is None:
+                if remaining(conn, run) == 0:
+                    break
+                time.sleep(POLL_SECONDS)  # 다른 워커의 임대 만료/재시도 대기
+                continue
+
+            unit_id, site, company, attempts = unit
+            module = importlib.import_module(SITE_MODULES[site])
+            print(f"[{worker}] {site}/{company} (시도 {attempts + 1})")
+
+            def heartbeat(unit_id=unit_id):
+                # 상세 페이지 사이(session.check)마다 임대를 연장해, 공고가 많은 기업도 중복 수집되지 않게 함
+                if not renew(conn, unit_id, worker, lease_seconds):
+                    raise LeaseLost(f"작업 {unit_id} 임대를 잃음")
+
+            try:
+                if site not in sessions:
+                    sessions[site] = BrowserSession(module.build_options)
+                    known[site] = load_results(site)  # 이미 수집된 공고 확인용 (병합 전까지 읽기 전용)
+                sessions[site].heartbeat = heartbeat
+                sessions[site].check()
+                rows, urls, searched = module.scrape_company(sessions[site], company, known[site])
+                if complete(conn, unit_id, worker, rows, urls, searched):
+                    done += 1
+            except LeaseLost as e:
+                # 다른 워커가 이어받았으므로 결과를 버리고 다음 작업으로 (실패로 기록하지 않음)
+                print(f"    [중단] {site}/{company}: {e}")
+            except Exception as e:
+                print(f"    [실패] {site}/{company}: {e}")
+                fail(conn, unit_id, worker, e, attempts + 1)
+                # 세션이 깨졌을 수 있으므로 다음 작업 전에 새 브라우저로 교체
+                if site in sessions:
+                    sessions[site].restart(f"작업 실패: {e}")
+    finally:
+        for session in sessions.values():
+            session.quit()
+    return done
+
+def merge(conn, run):
+    """완료된 작업 결과를 사이트별 CSV에 반영합니다.
+
+    기업의 작업이 검색까지 끝까지 완료된 경우에만 그 기업의 마감 처리와 스케줄 기록을 합니다.
+    날짜는 병합한 날이 아니라 실행 날짜(run_day)를 쓰므로, 같은 결과를 언제 여러 번 병합해도 CSV는 같습니다.
+    """
+    from competitor_csv import load_results, upsert_rows, save_results
+
+    today = run_day(conn, run)
+    for site in SITE_MODULES:
+        units = conn.execute(
+            "SELECT company, status, result FROM units WHERE run = ? AND site = ? ORDER BY id", (run, site)
+        ).fetchall()
+        if not units:
+            continue
+
+        df_old = load_results(site)
+        scraped_urls, finished, unfinished = [], set(), set()
+        for company, status, result in units:
+            if status != DONE:
+                unfinished.add(company)
+                continue
+            data = json.loads(result)
+            df_old = upsert_rows(df_old, data["rows"], today, reopen=site != "saramin")
+            scraped_urls.extend(data["urls"])
+            (finished if data.get("complete", True) else unfinished).add(company)
+        companies = sorted(finished - unfinished)
+
+        if unfinished:
+            print(f"[{site}] 미완료 기업 (마감 처리 제외): {', '.join(sorted(unfinished))}")
+        save_results(site, df_old, scraped_urls, companies, today, close_when_empty=site == "saramin")
+        print(f"[{site}] 병합 완료: 기업 {len(companies)}곳 / 확인한 공고 {len(set(scraped_urls))}건")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="사이트×기업 작업 큐로 여러 워커가 나눠 크롤링합니다.")
+    parser.add_argument("command", choices=["enqueue", "work", "merge", "status", "local"])
+    parser.add_argument("--db", default=QUEUE_FILE, help="작업 큐 파일 (러너끼리 공유)")
+    parser.add_argument("--run", default=today_run(), help="실행 구분 (기본: 오늘 날짜)")
+    parser.add_argument("--day", help="실행 날짜 YYYY-MM-DD (기본: 날짜 형식의 --run, 아니면 오늘)")
+    parser.add_argument("--sites", default=",".join(SITE_MODULES))
+    parser.add_argument("--worker", default=f"{socket.gethostname()}-{os.getpid()}")
+    parser.add_argument("--workers", type=int, default=1, help="전체 워커 수 (속도 제한 분배 / local 실행 시 프로세스 수)")
+    parser.add_argument("--lease", type=int, default=LEASE_SECONDS)
+    args = parser.parse_args(argv)
+
+    conn = connect(args.db)
+    sites = [s for s in args.sites.split(",") if s in SITE_MODULES]
+
+    if args.command == "enqueue":
+        added = enqueue(conn, args.run, plan_units(sites), args.day)
+        print(f"[큐] {args.run} 작업 {added}건 추가")
+    elif args.command == "work":
+        scale_rates(args.workers)
+        done = work(conn, args.run, args.worker, args.lease)
+        print(f"[{args.worker}] 완료 {done}건")
+    elif args.command == "merge":
+        merge(conn, args.run)
+    elif args.command == "status":
+        print(f"[큐] {args.run} {status_counts(conn, args.run)}")
+        for row in conn.execute("SELECT site, company, attempts, error FROM units WHERE run = ? AND status = ?", (args.run, FAILED)):
+            print(f"    실패: {row[0]}/{row[1]} ({row[2]}회) {row[3]}")
+    else:
+        # 한 머신에서 enqueue → 워커 N개 → merge 를 차례로 실행
+        added = enqueue(conn, args.run, plan_units(sites), args.day)
+        print(f"[큐] {args.run} 작업 {added}건 추가, 워커 {args.workers}개 시작")
+        procs = [
+            subprocess.Popen([
+                sys.executable, os.path.abspath(__file__), "work", "--db", args.db, "--run", args.run,
+                "--worker", f"{socket.gethostname()}-w{i}", "--workers", str(args.workers), "--lease", str(args.lease),
+            ])
+            for i in range(args.workers)
+        ]
+        for proc in procs:
+            proc.wait()
+        print(f"[큐] {args.run} {status_counts(conn, args.run)}")
+        merge(conn, args.run)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,79 @@
+import os
+import json
+import shutil
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+# 한 번 찾은 chromedriver 경로를 저장해 다음 실행부터는 네트워크 없이 바로 사용
+DRIVER_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "hr-crawler", "chromedriver.json")
+
+# (선택) 환경변수
+# - CHROMEDRIVER_PATH    : chromedriver 실행 파일 경로 고정
+# - CHROMEDRIVER_VERSION : webdriver-manager 로 받을 버전 고정
+# - CHROMEWEBDRIVER      : GitHub Actions 러너에 미리 설치된 chromedriver 폴더
+# - WEBDRIVER_TRACE      : 설정 시 모든 WebDriver 명령을 추적해 이 이름에 PID 를 붙인 파일로 저장 (webdriver_trace.py)
+
+# =========================================================
+# 2. 경로 결정
+# =========================================================
+
+def _read_cache():
+    try:
+        with open(DRIVER_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f).get("path")
+    except Exception:
+        return None
+
+def _write_cache(path):
+    os.makedirs(os.path.dirname(DRIVER_CACHE_FILE), exist_ok=True)
+    with open(DRIVER_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump({"path": path}, f)
+
+def _clear_cache():
+    if os.path.exists(DRIVER_CACHE_FILE):
+        os.remove(DRIVER_CACHE_FILE)
+
+def _local_driver_path():
+    """네트워크 없이 찾을 수 있는 chromedriver 경로 (없으면 None)"""
+    candidates = [
+        os.environ.get("CHROMEDRIVER_PATH"),
+        _read_cache(),
+        os.path.join(os.environ["CHROMEWEBDRIVER"], "chromedriver") if os.environ.get("CHROMEWEBDRIVER") else None,
+        shutil.which("chromedriver"),
+    ]
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+def resolve_driver_path(offline_first=True):
+    """chromedriver 경로를 결정합니다. 로컬에서 못 찾을 때만 webdriver-manager 로 내려받습니다."""
+    path = _local_driver_path() if offline_first else None
+    if not path:
+        # 버전 조회/다운로드가 필요한 경우에만 import (네트워크 사용)
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager(driver_version=os.environ.get("CHROMEDRIVER_VERSION")).install()
+    _write_cache(path)
+    return path
+
+# =========================================================
+# 3. 드라이버 생성
+# =========================================================
+
+def create_driver(options):
+    """캐시된 chromedriver 로 Chrome 을 띄우고, 버전이 맞지 않으면 한 번만 다시 받아 재시도합니다."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.common.exceptions import SessionNotCreatedException
+    from webdriver_trace import trace_driver
+
+    try:
+        driver = webdriver.Chrome(service=Service(resolve_driver_path()), options=options)
+    except SessionNotCreatedException as e:
+        # Chrome 업데이트 등으로 캐시된 드라이버 버전이 맞지 않는 경우
+        print(f"[드라이버] 캐시된 chromedriver 사용 실패, 다시 받습니다: {str(e).splitlines()[0]}")
+        _clear_cache()
+        driver = webdriver.Chrome(service=Service(resolve_driver_path(offline_first=False)), options=options)
+    return trace_driver(driver)
@@ -0,0 +1,93 @@
+import os
+import sys
+import time
+import argparse
+import pandas as pd
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+# 정규화 결과로 추가되는 숫자/구분 컬럼
+EXPERIENCE_COLUMNS = ["경력_최소", "경력_최대", "경력_구분"]
+
+# 파일별 경력 원본 컬럼 (BEP 마스터는 경력 컬럼이 없어 지원자격 본문에서 추출)
+EXPERIENCE_SOURCES = {
+    "saramin_results.csv": "경력",
+    "wanted_results.csv": "경력",
+    "remember_results.csv": "경력",
+    "BEP_EV_Recruitment_Master.csv": "지원자격",
+}
+
+# '경력 2~10년', '경력5년↑', '경력 3-7년', '관련 경력 5년 이상' 등
+_YEARS_RE = r"경력\s*(\d+)(?:\s*[~\-]\s*(\d+))?\s*년"
+
+# =========================================================
+# 2. 정규화 함수 (컬럼 단위 벡터 연산)
+# =========================================================
+
+def normalize_experience(series):
+    """경력 텍스트 컬럼을 경력_최소/경력_최대/경력_구분 DataFrame으로 변환합니다.
+
+    - 신입: 최소 0, 최대 0
+    - 무관 (경력무관, 신입·경력): 최소 0, 최대 없음
+    - 경력 N~M년: 최소 N, 최대 M / 경력 N년(↑, 이상): 최소 N, 최대 없음
+    """
+    text = series.fillna("").astype(str)
+    years = text.str.extract(_YEARS_RE)
+
+    has_new = text.str.contains("신입", regex=False)
+    has_career = text.str.contains("경력", regex=False)
+    is_any = text.str.contains("무관", regex=False) | (has_new & has_career)
+    is_new = has_new & ~is_any
+
+    result = pd.DataFrame(index=series.index)
+    result["경력_최소"] = pd.to_numeric(years[0], errors="coerce").astype("Int64")
+    result["경력_최대"] = pd.to_numeric(years[1], errors="coerce").astype("Int64")
+
+    result.loc[is_any | is_new, "경력_최소"] = 0
+    result.loc[is_new, "경력_최대"] = 0
+
+    result["경력_구분"] = "정보없음"
+    result.loc[has_career, "경력_구분"] = "경력"
+    result.loc[is_new, "경력_구분"] = "신입"
+    result.loc[is_any, "경력_구분"] = "무관"
+    return result
+
+def add_experience_columns(df, source_col="경력"):
+    """DataFrame에 정규화된 경력 컬럼을 추가(갱신)합니다."""
+    if source_col not in df.columns:
+        for col in EXPERIENCE_COLUMNS:
+            df[col] = pd.NA
+        return df
+    normalized = normalize_experience(df[source_col])
+    for col in EXPERIENCE_COLUMNS:
+        df[col] = normalized[col]
+    return df
+
+# =========================================================
+# 3. 배치 백필 (기존 CSV 전체)
+# =========================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="기존 CSV의 경력 정보를 숫자 컬럼으로 일괄 정규화합니다.")
+    parser.add_argument("files", nargs="*", default=list(EXPERIENCE_SOURCES))
+    parser.add_argument("--dry-run", action="store_true", help="CSV를 저장하지 않고 결과만 출력")
+    args = parser.parse_args(argv)
+
+    for file_name in args.files:
+        if not os.path.exists(file_name):
+            print(f"[Skip] 파일 없음: {file_name}")
+            continue
+        df = pd.read_csv(file_name, encoding="utf-8-sig")
+        start = time.perf_counter()
+        add_experience_columns(df, EXPERIENCE_SOURCES.get(file_name, "경력"))
+        elapsed = time.perf_counter() - start
+
+        counts = df["경력_구분"].value_counts().to_dict()
+        print(f"[{file_name}] {len(df)}행 정규화 {elapsed * 1000:.1f}ms / {counts}")
+        if not args.dry_run:
+            df.to_csv(file_name, index=False, encoding="utf-8-sig")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,43 +1,26 @@
-import pandas as pd
-import requests
 import os
 import sys
 from datetime import datetime
 
+from postings import SOURCES, load_postings
+
 # =========================================================
 # 1. 설정 정보 (GitHub Secrets 사용)
 # =========================================================
 
 SLACK_WEBHOOK_URL = os.environ.get("SLACK_WEBHOOK_URL")
 
-if not SLACK_WEBHOOK_URL:
-    print("❌ [에러] SLACK_WEBHOOK_URL 환경변수가 설정되지 않았습니다.")
-    sys.exit(1)
-
 DASHBOARD_LINK = "https://ian939.github.io/HR-crawler-updated/"
 LOG_FILE = "sent_logs.txt"
 
-# 감시할 CSV 파일 리스트 및 설정
-TARGET_FILES = [
-    {
-        "name": "사람인(Saramin)",
-        "filename": "saramin_results.csv",
-        "date_col": "first-seen",
-        "url_col": "URL",
-        "title_col": "공고명",
-        "company_col": "기업명",        # CSV에 기업명 컬럼이 있는 경우
-        "default_company": "알수없음"   # 컬럼이 비었을 때 대체 텍스트
-    },
-    {
-        "name": "워터(BEP)",
-        "filename": "BEP_EV_Recruitment_Master.csv",
-        "date_col": "first_seen",
-        "url_col": "상세URL",
-        "title_col": "공고명",
-        "company_col": None,            # CSV에 기업명 컬럼이 없는 경우
-        "default_company": "워터(BEP)" # 고정된 기업명 사용
-    }
-]
+# (선택) 최소 경력 요구가 이 값(년)을 넘는 공고는 알림에서 제외
+MAX_EXPERIENCE_YEARS = os.environ.get("MAX_EXPERIENCE_YEARS")
+
+# (선택) BEP 직무 관련도(relevance.py, 0~1)가 이 값보다 낮은 경쟁사 공고는 알림에서 제외
+MIN_RELEVANCE = os.environ.get("MIN_RELEVANCE")
+
+# 알림 대상 사이트 (CSV 구조는 postings.SOURCES 에서 관리)
+NOTIFY_SITES = ["saramin", "bep"]
 
 # =========================================================
 # 2. 함수 정의
@@ -56,6 +39,17 @@ def save_sent_urls(urls):
         for url in urls:
             f.write(f"{url}\n")
 
+def format_experience(posting):
+    """정규화된 경력 값(exp_min/exp_max/exp_kind)을 짧은 문구로 변환"""
+    low, high = posting.exp_min, posting.exp_max
+    if posting.exp_kind in ("신입", "무관"):
+        return "신입" if posting.exp_kind == "신입" else "경력무관"
+    if low is not None and high is not None:
+        return f"경력 {low}~{high}년"
+    if low is not None:
+        return f"경력 {low}년↑"
+    return ""
+
 def send_slack_message(source_name, jobs):
     """슬랙 알림 전송 (디자인 수정됨)"""
     if not jobs:
@@ -97,19 +91,21 @@ def send_slack_message(source_name, jobs):
         company = job['company']
         title = job['title']
         link = job['url']
+        experience = f" ({job['experience']})" if job.get('experience') else ""
         
         blocks.append({
             "type": "section",
             "text": {
                 "type": "mrkdwn",
-                # [기업명] 공고제목 형태로 표시
-                "text": f"• *[{company}] {title}*\n   📄 <{link}|공고 내용 자세히 보기>"
+                # [기업명] 공고제목 (경력) 형태로 표시
+                "text": f"• *[{company}] {title}*{experience}\n   📄 <{link}|공고 내용 자세히 보기>"
             }
         })
 
     payload = {"blocks": blocks}
 
     try:
+        import requests
         response = requests.post(SLACK_WEBHOOK_URL, json=payload)
         response.raise_for_status()
         print(f"[{source_name}] 슬랙 전송 성공")
@@ -121,59 +117,55 @@ def send_slack_message(source_name, jobs):
 # =========================================================
 
 def main():
+    if not SLACK_WEBHOOK_URL:
+        print("❌ [에러] SLACK_WEBHOOK_URL 환경변수가 설정되지 않았습니다.")
+        sys.exit(1)
+
     today_str = datetime.now().strftime("%Y-%m-%d")
     print(f"--- {today_str} 신규 공고 알림 체크 ---")
     
     sent_urls = load_sent_urls()
     newly_sent_urls = []
 
-    for target in TARGET_FILES:
-        file_path = target["filename"]
-        
-        if not os.path.exists(file_path):
-            print(f"[Skip] 파일 없음: {file_path}")
-            continue
-            
+    # 정규화된 공고 데이터셋 (CSV가 바뀌지 않았으면 캐시 사용)
+    postings = load_postings(NOTIFY_SITES)
+
+    for site in NOTIFY_SITES:
+        label = SOURCES[site]["label"]
         try:
-            df = pd.read_csv(file_path)
-            df[target["date_col"]] = df[target["date_col"]].astype(str)
-            
             # 오늘 날짜 & 미발송 URL 필터링
-            new_jobs_df = df[
-                (df[target["date_col"]] == today_str) & 
-                (~df[target["url_col"]].isin(sent_urls))
+            new_jobs = [
+                p for p in postings
+                if p.site == site and p.first_seen == today_str and p.url not in sent_urls
             ]
 
-            if not new_jobs_df.empty:
-                print(f"[{target['name']}] 알림 대상: {len(new_jobs_df)}건")
+            # 경력 필터 (숫자 값이 있는 경우에만 적용)
+            if MAX_EXPERIENCE_YEARS:
+                new_jobs = [p for p in new_jobs if p.exp_min is None or p.exp_min <= float(MAX_EXPERIENCE_YEARS)]
+
+            # 관련도 필터 (점수가 매겨진 공고에만 적용, BEP 공고는 해당 없음)
+            if MIN_RELEVANCE:
+                new_jobs = [p for p in new_jobs if p.relevance is None or p.relevance >= float(MIN_RELEVANCE)]
+
+            if new_jobs:
+                print(f"[{label}] 알림 대상: {len(new_jobs)}건")
                 
                 jobs_to_send = []
-                for _, row in new_jobs_df.iterrows():
-                    # 기업명 추출 로직
-                    if target["company_col"] and target["company_col"] in df.columns:
-                        company_name = str(row[target["company_col"]])
-                        # 값이 비어있으면 기본값 사용
-                        if company_name == "nan" or not company_name.strip():
-                            company_name = target["default_company"]
-                    else:
-                        company_name = target["default_company"]
-
-                    url = str(row[target['url_col']])
-                    title = str(row[target['title_col']])
-                    
+                for p in new_jobs:
                     jobs_to_send.append({
-                        "company": company_name,
-                        "title": title, 
-                        "url": url
+                        "company": p.company,
+                        "title": p.title, 
+                        "url": p.url,
+                        "experience": format_experience(p)
                     })
-                    newly_sent_urls.append(url)
+                    newly_sent_urls.append(p.url)
                 
-                send_slack_message(target["name"], jobs_to_send)
+                send_slack_message(label, jobs_to_send)
             else:
-                print(f"[{target['name']}] 신규 공고 없음")
+                print(f"[{label}] 신규 공고 없음")
 
         except Exception as e:
-            print(f"[{target['name']}] 오류 발생: {e}")
+            print(f"[{label}] 오류 발생: {e}")
 
     if newly_sent_urls:
         save_sent_urls(newly_sent_urls)
@@ -182,4 +174,8 @@ def main():
         print("전송할 내역이 없습니다.")
 
 if __name__ == "__main__":
-    main()
+    if "--startup-profile" in sys.argv:
+        from startup_profile import report
+        report("notify_new_jobs")
+    else:
+        main()
@@ -0,0 +1,194 @@
+import os
+import sys
+import glob
+import time
+import hashlib
+import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from section_parser import parse_sections
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+# 파싱 프로세스 수 (Chrome 도 CPU 를 쓰므로 코어 하나는 남김). 0 이면 브라우저와 같은 스레드에서 파싱
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", max(1, min(4, (os.cpu_count() or 2) - 1))))
+MAX_PENDING = 8  # 파싱 대기 중인 page_source 상한 (가득 차면 브라우저가 기다림)
+
+# PAGE_FIXTURES=<디렉터리> 로 켜면 파이프라인에 넘어온 page_source 를 저장 (bench 입력)
+FIXTURE_DIR = os.environ.get("PAGE_FIXTURES", "")
+DEFAULT_FIXTURE_DIR = os.path.join(".cache", "page_fixtures")
+
+def _backend():
+    """설치돼 있으면 lxml (html.parser 보다 빠름), 없으면 기본 파서"""
+    try:
+        import lxml  # noqa: F401
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+PARSER = _backend()
+
+# =========================================================
+# 2. 파싱 함수 (프로세스 풀에서 실행되므로 모듈 최상위 함수)
+# =========================================================
+
+def page_lines(html, roots=("main", "body")):
+    """page_source 에서 본문 영역(roots 중 처음 찾은 태그)의 텍스트 줄 목록"""
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    # 첫 번째 본문 태그만 트리로 만들면 메뉴/스크립트가 큰 페이지에서 훨씬 빠름. 없으면 전체 파싱
+    content = BeautifulSoup(html, PARSER, parse_only=SoupStrainer(roots[0])).find(roots[0])
+    if content is None:
+        soup = BeautifulSoup(html, PARSER)
+        content = next((node for node in map(soup.find, roots[1:]) if node), soup)
+    return content.get_text(separator="\n", strip=True).split("\n")
+
+def parse_detail(html):
+    """상세 페이지 → 섹션 컬럼 dict (section_parser 기준)"""
+    return parse_sections(page_lines(html))
+
+# =========================================================
+# 3. 파이프라인
+# =========================================================
+
+class ParsePipeline:
+    """브라우저(생산자)가 넘긴 page_source 를 프로세스 풀(소비자)이 파싱해, 페이지 로드와 파싱을 겹칩니다.
+
+    submit() 은 파싱 대기가 max_pending 개면 자리가 날 때까지 막히고,
+    results() 는 제출 순서대로 (키, 결과, 오류) 를 돌려줍니다.
+    """
+
+    def __init__(self, parse=parse_detail, workers=PARSE_WORKERS, max_pending=MAX_PENDING):
+        self.parse = parse
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = []
+        self._pool = None
+
+    def __enter__(self):
+        if self.workers > 0:
+            try:
+                self._pool = ProcessPoolExecutor(self.workers)
+            except (OSError, NotImplementedError) as e:
+                print(f"    [파싱] 프로세스 풀 사용 불가, 같은 스레드에서 파싱: {e}")
+        return self
+
+    def __exit__(self, *exc):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=exc[0] is not None)
+
+    def submit(self, key, html):
+        if FIXTURE_DIR:
+            save_fixture(html, FIXTURE_DIR)
+        if self._pool is None:
+            try:
+                self._pending.append((key, self.parse(html), None))
+            except Exception as e:
+                self._pending.append((key, None, e))
+            return
+        self._slots.acquire()
+        future = self._pool.submit(self.parse, html)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._pending.append((key, future, None))
+
+    def results(self):
+        pending, self._pending = self._pending, []
+        for key, future, error in pending:
+            if self._pool is None:
+                yield key, future, error
+                continue
+            try:
+                yield key, future.result(), None
+            except Exception as e:
+                yield key, None, e
+
+def save_fixture(html, fixture_dir):
+    """page_source 를 내용 해시 이름으로 저장 (같은 페이지는 한 번만)"""
+    os.makedirs(fixture_dir, exist_ok=True)
+    path = os.path.join(fixture_dir, hashlib.sha256(html.encode("utf-8")).hexdigest()[:16] + ".html")
+    if not os.path.exists(path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+
+# =========================================================
+# 4. 처리량 측정 (저장된 page_source 기준)
+# =========================================================
+
+def _chrome_markup(page_kb):
+    """실제 SPA 상세 페이지처럼 본문 밖에 붙는 메뉴/푸터/스크립트 (약 page_kb KB)"""
+    item = "<li class='nav-item'><a class='nav-link' href='/menu/{0}'><span>메뉴 {0}</span></a></li>"
+    nav = "<nav><ul>" + "".join(item.format(i) for i in range(page_kb * 4)) + "</ul></nav>"
+    data = "<script id='__NEXT_DATA__' type='application/json'>" + '{"k":"' + "x" * (page_kb * 512) + '"}</script>'
+    return nav, data
+
+def make_fixtures(fixture_dir, count, page_kb=0):
+    """가상 채용 사이트(standin_server)의 워터 상세 페이지 count 개를 저장합니다.
+
+    page_kb 를 주면 본문 밖에 메뉴/스크립트를 덧붙여 실제 페이지 크기에 가깝게 만듭니다.
+    """
+    import requests
+    from standin_server import JobBoard, start_server
+
+    board = JobBoard(companies=1, postings_per_company=1, water_postings=count)
+    server, url = start_server(board)
+    nav, data = _chrome_markup(page_kb) if page_kb else ("", "")
+    try:
+        ids = board.open_ids("water")
+        for pid in ids:
+            html = requests.get(f"{url}/water/recruitments/{pid}").text
+            save_fixture(html.replace("<main>", nav + "<main>", 1).replace("</body>", data + "</body>", 1), fixture_dir)
+    finally:
+        server.shutdown()
+    print(f"[픽스처] {len(ids)}개 저장: {fixture_dir}")
+
+def bench(fixture_dir, workers, fetch_ms, repeat):
+    """순차(로드 → 파싱)와 파이프라인(로드와 파싱 겹침)의 페이지/초를 비교합니다.
+
+    브라우저 로드 시간은 fetch_ms 만큼 대기하는 것으로 대신합니다 (0 이면 파싱 처리량만).
+    """
+    pages = []
+    for path in sorted(glob.glob(os.path.join(fixture_dir, "*.html"))):
+        with open(path, "r", encoding="utf-8") as f:
+            pages.append(f.read())
+    if not pages:
+        print(f"[Skip] 픽스처 없음: {fixture_dir} (make-fixtures 또는 PAGE_FIXTURES 로 먼저 저장)")
+        return
+    pages = pages * repeat
+    print(f"[측정] 페이지 {len(pages)}개 (평균 {sum(map(len, pages)) / len(pages) / 1024:.0f}KB), 파서 {PARSER}, 로드 {fetch_ms}ms 가정")
+
+    def run(n_workers):
+        start = time.perf_counter()
+        with ParsePipeline(workers=n_workers) as pipeline:
+            for i, html in enumerate(pages):
+                time.sleep(fetch_ms / 1000)
+                pipeline.submit(i, html)
+            results = list(pipeline.results())
+        elapsed = time.perf_counter() - start
+        errors = sum(1 for _, _, e in results if e)
+        return elapsed, errors
+
+    for label, n_workers in (("순차", 0), (f"파이프라인(프로세스 {workers}개)", workers)):
+        elapsed, errors = run(n_workers)
+        print(f"  {label:<20} {elapsed:7.2f}초  {len(pages) / elapsed:7.1f}페이지/초  오류 {errors}건")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="상세 페이지 파싱 파이프라인의 처리량을 저장된 페이지로 측정합니다.")
+    parser.add_argument("command", choices=["make-fixtures", "bench"])
+    parser.add_argument("--dir", default=FIXTURE_DIR or DEFAULT_FIXTURE_DIR, help="page_source 픽스처 디렉터리")
+    parser.add_argument("--count", type=int, default=200, help="make-fixtures: 저장할 페이지 수")
+    parser.add_argument("--page-kb", type=int, default=0, help="make-fixtures: 본문 밖 메뉴/스크립트 크기(KB)")
+    parser.add_argument("--workers", type=int, default=PARSE_WORKERS)
+    parser.add_argument("--fetch-ms", type=float, default=0, help="bench: 페이지당 브라우저 로드 시간 가정(ms)")
+    parser.add_argument("--repeat", type=int, default=1, help="bench: 픽스처를 반복해 늘림")
+    args = parser.parse_args(argv)
+
+    if args.command == "make-fixtures":
+        make_fixtures(args.dir, args.count, args.page_kb)
+    else:
+        bench(args.dir, args.workers, args.fetch_ms, args.repeat)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,173 @@
+import os
+import csv
+import pickle
+
+# =========================================================
+# 1. 설정 (사이트별 CSV 구조를 한 곳에서 정의)
+# =========================================================
+
+# 모든 CSV에 공통으로 쓰이는 컬럼
+COMMON_COLUMNS = {
+    "completed_date": "completed_date",
+    "exp_min": "경력_최소",
+    "exp_max": "경력_최대",
+    "exp_kind": "경력_구분",
+}
+
+COMPETITOR_COLUMNS = {
+    "company": "기업명",
+    "title": "공고명",
+    "experience": "경력",
+    "preview": "공고문 컬럼",
+    "body_hash": "본문 해시",
+    "url": "URL",
+    "first_seen": "first-seen",
+    "relevance": "관련도",            # relevance.py 가 채움 (BEP 직무와의 유사도)
+    "related_role": "관련 BEP 공고",
+}
+
+SOURCES = {
+    "saramin": {
+        "label": "사람인(Saramin)",
+        "filename": "saramin_results.csv",
+        "columns": COMPETITOR_COLUMNS,
+        "default_company": "알수없음",
+    },
+    "wanted": {
+        "label": "원티드(Wanted)",
+        "filename": "wanted_results.csv",
+        "columns": COMPETITOR_COLUMNS,
+        "default_company": "알수없음",
+    },
+    "remember": {
+        "label": "리멤버(Remember)",
+        "filename": "remember_results.csv",
+        "columns": COMPETITOR_COLUMNS,
+        "default_company": "알수없음",
+    },
+    "bep": {
+        "label": "워터(BEP)",
+        "filename": "BEP_EV_Recruitment_Master.csv",
+        "columns": {
+            "title": "공고명",
+            "division": "부문",
+            "duties": "주요업무",
+            "url": "상세URL",
+            "first_seen": "first_seen",
+        },
+        "default_company": "워터(BEP)",  # BEP 마스터에는 기업명 컬럼이 없음
+    },
+}
+
+# 정규화된 데이터셋 캐시 (원본 CSV 수정 시각/크기가 바뀌면 다시 생성)
+CACHE_FILE = os.path.join(".cache", "postings.pkl")
+CACHE_VERSION = 2
+
+# =========================================================
+# 2. 공고 레코드
+# =========================================================
+
+FIELDS = (
+    "site", "company", "title", "division", "experience", "exp_min", "exp_max", "exp_kind",
+    "url", "first_seen", "completed_date", "body_hash", "preview", "duties", "relevance", "related_role",
+)
+
+class Posting:
+    """사이트와 무관한 공고 1건 (본문은 body_hash 로 body_store 에서 조회)"""
+    __slots__ = FIELDS
+
+    def __init__(self, *values):
+        for name, value in zip(FIELDS, values):
+            setattr(self, name, value)
+
+    @property
+    def is_open(self):
+        return not self.completed_date
+
+    def as_tuple(self):
+        return tuple(getattr(self, name) for name in FIELDS)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in FIELDS}
+
+    def __repr__(self):
+        return f"Posting({self.site}, {self.company}, {self.title!r})"
+
+# =========================================================
+# 3. 로더
+# =========================================================
+
+def _to_years(value):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+def _to_score(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _read_source(site):
+    """CSV 하나를 읽어 Posting 튜플 리스트로 정규화합니다."""
+    source = SOURCES[site]
+    columns = {**COMMON_COLUMNS, **source["columns"]}
+    rows = []
+    with open(source["filename"], "r", encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            values = {field: (row.get(col) or "").strip() for field, col in columns.items()}
+            if values.get("completed_date") in ("-", "nan"):
+                values["completed_date"] = ""
+            values["site"] = site
+            values["company"] = values.get("company") or source["default_company"]
+            values["exp_min"] = _to_years(values.get("exp_min"))
+            values["exp_max"] = _to_years(values.get("exp_max"))
+            values["relevance"] = _to_score(values.get("relevance"))
+            rows.append(tuple(values.get(name, "") for name in FIELDS))
+    return rows
+
+def _cache_key():
+    key = [CACHE_VERSION]
+    for site in SOURCES:
+        path = SOURCES[site]["filename"]
+        if os.path.exists(path):
+            stat = os.stat(path)
+            key.append((site, stat.st_mtime_ns, stat.st_size))
+        else:
+            key.append((site, None, None))
+    return key
+
+def load_postings(sites=None, use_cache=True):
+    """모든(또는 지정한) 사이트의 공고를 Posting 리스트로 반환합니다.
+
+    원본 CSV가 바뀌지 않았다면 캐시된 바이너리(pickle)를 그대로 사용합니다.
+    캐시는 항상 전체 사이트 기준으로 만들고, sites 는 읽은 뒤 걸러냅니다.
+    """
+    sites = set(sites or SOURCES)
+    rows = _load_rows(use_cache)
+    return [Posting(*t) for t in rows if t[0] in sites]
+
+def _load_rows(use_cache):
+    key = _cache_key()
+    if use_cache and os.path.exists(CACHE_FILE):
+        try:
+            with open(CACHE_FILE, "rb") as f:
+                cached = pickle.load(f)
+            if cached["key"] == key:
+                return cached["rows"]
+        except Exception:
+            pass
+
+    rows = []
+    for site in SOURCES:
+        if not os.path.exists(SOURCES[site]["filename"]):
+            print(f"[Skip] 파일 없음: {SOURCES[site]['filename']}")
+            continue
+        rows.extend(_read_source(site))
+
+    if use_cache:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, "wb") as f:
+            pickle.dump({"key": key, "rows": rows}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return rows
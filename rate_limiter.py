@@ -0,0 +1,180 @@
+import os
+import re
+import time
+import random
+import threading
+from urllib.parse import urlparse
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+# 호스트별 시작 속도 (초당 요청 수). 없는 호스트는 DEFAULT_RATE 사용
+HOST_RATES = {
+    "www.saramin.co.kr": 0.5,
+    "www.wanted.co.kr": 0.5,
+    "career.rememberapp.co.kr": 0.5,
+    "watercharging.com": 0.5,
+}
+# CRAWL_DEFAULT_RATE 환경변수로 조정 가능 (로컬 가상 사이트 부하 테스트용)
+DEFAULT_RATE = float(os.environ.get("CRAWL_DEFAULT_RATE", 0.5))
+MIN_RATE = 0.05       # 차단 신호가 계속돼도 이 이하로는 내리지 않음
+MAX_RATE = max(2.0, DEFAULT_RATE)  # 사이트가 잘 버텨도 이 이상으로는 올리지 않음
+BURST = 2             # 토큰 버킷 최대 용량
+
+RECOVER_AFTER = 5     # 연속 성공 N회마다 속도 회복
+RECOVER_FACTOR = 1.25
+EMPTY_FACTOR = 0.8    # 빈 결과 페이지: 약한 감속
+BASE_BACKOFF = 10     # 차단 신호: 첫 대기(초), 이후 2배씩
+MAX_BACKOFF = 300
+
+# 캡차/차단 페이지에 나타나는 문구
+BLOCK_MARKERS = [
+    "captcha", "recaptcha", "자동입력 방지", "자동 입력 방지", "비정상적인 접근", "비정상적인 요청",
+    "접근이 차단", "접근이 제한", "access denied", "too many requests", "are you a robot", "보안 문자",
+]
+
+# 정상적인 '검색 결과 없음' 안내 문구 (이 문구가 보이면 빈 결과를 차단 신호로 보지 않음)
+NO_RESULT_MARKERS = ["결과가 없습니다", "공고가 없습니다", "찾지 못했습니다"]
+
+# 페이지 상태 신호
+OK = "ok"
+EMPTY = "empty"
+THROTTLED = "throttled"
+
+# =========================================================
+# 2. 호스트별 토큰 버킷
+# =========================================================
+
+class _HostState:
+    __slots__ = ("rate", "tokens", "last", "blocked_until", "strikes", "successes")
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = 1.0
+        self.last = time.monotonic()
+        self.blocked_until = 0.0
+        self.strikes = 0
+        self.successes = 0
+
+class RateLimiter:
+    """호스트별 토큰 버킷 + 차단 신호에 따른 적응형 감속/회복"""
+
+    def __init__(self, host_rates=None, default_rate=DEFAULT_RATE, min_rate=MIN_RATE, max_rate=MAX_RATE, burst=BURST):
+        self.host_rates = host_rates if host_rates is not None else HOST_RATES
+        self.default_rate = default_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _state(self, host):
+        if host not in self._hosts:
+            self._hosts[host] = _HostState(self.host_rates.get(host, self.default_rate))
+        return self._hosts[host]
+
+    def wait(self, url):
+        """해당 호스트에 요청을 보내도 될 때까지 대기합니다."""
+        host = urlparse(url).netloc
+        while True:
+            with self._lock:
+                state = self._state(host)
+                now = time.monotonic()
+                state.tokens = min(self.burst, state.tokens + (now - state.last) * state.rate)
+                state.last = now
+                if now >= state.blocked_until and state.tokens >= 1:
+                    state.tokens -= 1
+                    return
+                delay = max(state.blocked_until - now, (1 - state.tokens) / state.rate)
+            # 요청 간격이 기계적으로 일정하지 않도록 약간의 지터 추가
+            time.sleep(delay * random.uniform(1.0, 1.2))
+
+    def report(self, url, signal=OK):
+        """요청 결과 신호(OK / EMPTY / THROTTLED)를 반영해 호스트 속도를 조절합니다."""
+        host = urlparse(url).netloc
+        with self._lock:
+            state = self._state(host)
+            if signal == THROTTLED:
+                state.rate = max(self.min_rate, state.rate / 2)
+                backoff = min(MAX_BACKOFF, BASE_BACKOFF * 2 ** state.strikes)
+                state.blocked_until = time.monotonic() + backoff
+                state.strikes += 1
+                state.successes = 0
+                print(f"    [속도 제한] {host} 차단 신호 → {backoff:.0f}초 대기, 초당 {state.rate:.2f}회")
+            elif signal == EMPTY:
+                state.rate = max(self.min_rate, state.rate * EMPTY_FACTOR)
+                state.successes = 0
+            else:
+                state.successes += 1
+                if state.successes >= RECOVER_AFTER:
+                    state.rate = min(self.max_rate, state.rate * RECOVER_FACTOR)
+                    state.strikes = max(0, state.strikes - 1)
+                    state.successes = 0
+
+# 브라우저 페이지 로드용 공용 인스턴스 (네 스크래퍼가 함께 사용)
+limiter = RateLimiter()
+
+# =========================================================
+# 3. 신호 감지 / 브라우저 헬퍼
+# =========================================================
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+def detect_block(text):
+    """페이지 제목/보이는 텍스트에 캡차/차단 문구가 있는지 확인합니다 (HTML 원문에는 쓰지 않음)."""
+    text = (text or "").lower()
+    return any(marker in text for marker in BLOCK_MARKERS)
+
+def shows_no_results(text):
+    """보이는 텍스트에 '검색 결과 없음' 안내가 있는지 확인합니다."""
+    return any(marker in (text or "") for marker in NO_RESULT_MARKERS)
+
+def http_signal(status_code, text=""):
+    """HTTP 응답을 신호로 변환 (429/403/503 또는 <title> 의 차단 문구 → THROTTLED)
+
+    일반 페이지도 reCAPTCHA 스크립트나 속성 값에 같은 단어를 담고 있으므로 본문 HTML 은 보지 않습니다.
+    """
+    if status_code in (429, 403, 503):
+        return THROTTLED
+    title = _TITLE_RE.search(text[:20000] if text else "")
+    if title and detect_block(title.group(1)):
+        return THROTTLED
+    return OK
+
+def check_page(driver, url, ready=None, timeout=10, empty_signal=True, limiter=limiter):
+    """현재 페이지 로딩 완료를 기다리고 신호를 판정해 limiter 에 보고합니다.
+
+    ready: 기다릴 요소 (By, selector). 시간 안에 안 나타나면 empty_signal 이 True 일 때 EMPTY.
+           단, 페이지에 '검색 결과 없음' 안내가 보이면 공고가 없는 정상 페이지이므로 OK.
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    signal = OK
+    try:
+        WebDriverWait(driver, timeout).until(lambda d: d.execute_script("return document.readyState") == "complete")
+        if ready:
+            WebDriverWait(driver, timeout).until(EC.presence_of_element_located(ready))
+    except Exception:
+        signal = EMPTY if empty_signal else OK
+
+    try:
+        title = driver.title
+        body = driver.find_element(By.TAG_NAME, "body").text[:3000]
+        if detect_block(title + " " + body):
+            signal = THROTTLED
+        elif signal == EMPTY and shows_no_results(body):
+            signal = OK
+    except Exception:
+        pass
+
+    limiter.report(url, signal)
+    return signal
+
+def browser_get(driver, url, ready=None, timeout=10, empty_signal=True, limiter=limiter):
+    """속도 제한을 지켜 페이지를 열고 신호(OK / EMPTY / THROTTLED)를 반환합니다."""
+    limiter.wait(url)
+    driver.get(url)
+    return check_page(driver, url, ready, timeout, empty_signal, limiter)
@@ -0,0 +1,305 @@
+import os
+import sys
+import time
+import hashlib
+import argparse
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+# 경쟁사 CSV 에 추가되는 컬럼: BEP 공고와의 최대 유사도(0~1), 가장 비슷한 BEP 공고명
+RELEVANCE_COLUMNS = ["관련도", "관련 BEP 공고"]
+
+# 이 점수 이상이면 BEP 직무와 관련 있는 공고로 봄 (대시보드 '관련 공고만' 보기)
+RELEVANT_SCORE = float(os.environ.get("RELEVANT_SCORE", 0.3))
+
+# BEP 직무 코퍼스: 게시중인 BEP 공고의 공고명/주요업무/지원자격
+ROLE_FILE = "BEP_EV_Recruitment_Master.csv"
+ROLE_TEXT_COLUMNS = ["공고명", "주요업무", "지원자격"]
+
+SCORE_FILES = ["saramin_results.csv", "wanted_results.csv", "remember_results.csv"]
+
+# 학습한 n-gram 사전/IDF/직무 벡터 (BEP 코퍼스가 같으면 다음 실행에서 재사용)
+VOCAB_FILE = os.path.join(".cache", "relevance_vocab.npz")
+VOCAB_VERSION = 1
+
+MAX_CHARS = 2000          # 공고당 제목 + 본문 앞부분만 사용 (직무 내용이 앞쪽에 몰려 있음)
+CHUNK_DOCS = 1000         # 한 번에 벡터화하는 공고 수 (메모리 상한)
+COUNT_CELLS = 4_000_000   # 청크의 (공고 수 × 사전 크기) 상한 (단어 횟수를 bincount 로 셀 수 있는 크기)
+
+# =========================================================
+# 2. 문자 n-gram 벡터화 (한글 음절/영문/숫자의 2~3글자 조각)
+# =========================================================
+
+def _word_chars():
+    """n-gram 에 쓰는 글자 여부 (BMP 코드포인트별)"""
+    import numpy as np
+
+    word = np.zeros(0x10000, bool)
+    word[0xAC00:0xD7A4] = True          # 한글 음절
+    word[ord("a"):ord("z") + 1] = True  # 영문 (소문자로 맞춤)
+    word[ord("0"):ord("9") + 1] = True
+    return word
+
+def _codepoints(texts):
+    """문서 목록 → (소문자 코드포인트 배열, 문서 번호 배열). 문서 사이에는 \\0 을 넣어 n-gram 이 이어지지 않게 함"""
+    import numpy as np
+
+    cp = np.frombuffer(("\0".join(texts) + "\0").encode("utf-32-le"), dtype=np.uint32)
+    cp = np.minimum(np.where((cp >= 65) & (cp <= 90), cp + 32, cp), 0xFFFF)
+    doc = np.repeat(np.arange(len(texts)), [len(t) + 1 for t in texts])
+    return cp, doc
+
+def _symbol_table(alphabet):
+    """글자 → 기호 번호 (0: 구분 문자, 1..A: 사전 글자, A+1: 사전에 없는 글자)"""
+    import numpy as np
+
+    table = np.zeros(0x10000, np.int32)
+    table[_word_chars()] = len(alphabet) + 1
+    table[alphabet] = np.arange(1, len(alphabet) + 1)
+    return table
+
+class RoleIndex:
+    """BEP 직무 코퍼스로 학습한 TF-IDF 사전과 직무 벡터 (정규화된 조밀 행렬)"""
+
+    def __init__(self, key, alphabet, bigrams, trigrams, idf, matrix, titles):
+        import numpy as np
+
+        self.key = key
+        self.alphabet = alphabet  # 코퍼스에 나온 글자 (정렬된 코드포인트)
+        self.bigrams = bigrams    # 정렬된 2-gram 코드
+        self.trigrams = trigrams  # 정렬된 3-gram 코드
+        self.idf = idf
+        self.matrix = matrix      # (직무 수, 사전 크기), 행마다 L2 정규화
+        self.titles = titles
+
+        self.base = len(alphabet) + 2
+        self.table = _symbol_table(alphabet)
+        # 2-gram 은 기호 쌍으로 바로 찾는 표, 3-gram 은 이진 탐색
+        self.bigram_id = np.full(self.base * self.base, -1, np.int32)
+        self.bigram_id[bigrams] = np.arange(len(bigrams))
+
+    @property
+    def size(self):
+        return len(self.bigrams) + len(self.trigrams)
+
+    def term_counts(self, texts):
+        """문서 목록 → (문서 번호, 단어 번호, 횟수). 문서 번호 순으로 정렬, 사전에 있는 n-gram 만"""
+        import numpy as np
+
+        cp, doc = _codepoints(texts)
+        sym = self.table[cp]
+        s0, s1 = sym[:-1], sym[1:]
+        bi = np.full(len(s0), -1, np.int32)
+        valid = (s0 > 0) & (s1 > 0)
+        bi[valid] = self.bigram_id[s0[valid] * self.base + s1[valid]]
+
+        # 3-gram 은 두 2-gram 이 모두 사전에 있을 때만 사전에 있을 수 있음
+        cand = np.flatnonzero((bi[:-1] >= 0) & (bi[1:] >= 0))
+        code = (s0[cand].astype(np.int64) * self.base + s1[cand]) * self.base + sym[cand + 2]
+        pos = np.minimum(np.searchsorted(self.trigrams, code), max(len(self.trigrams) - 1, 0))
+        hit = self.trigrams[pos] == code if len(self.trigrams) else np.zeros(len(cand), bool)
+
+        bi_pos = np.flatnonzero(bi >= 0)
+        docs = np.concatenate([doc[bi_pos], doc[cand[hit]]]).astype(np.int64)
+        terms = np.concatenate([bi[bi_pos], pos[hit] + len(self.bigrams)])
+        # (문서, 단어) 칸별 횟수. 칸 수가 작으면 정렬 없이 bincount 로 셈
+        keys = docs * self.size + terms
+        if len(texts) * self.size <= COUNT_CELLS:
+            counts = np.bincount(keys, minlength=len(texts) * self.size)
+            keys = np.flatnonzero(counts)
+            counts = counts[keys]
+        else:
+            keys, counts = np.unique(keys, return_counts=True)
+        return keys // self.size, keys % self.size, counts
+
+    def weights(self, texts):
+        """문서별 L2 정규화된 TF-IDF (희소 형식: 문서 번호, 단어 번호, 가중치)"""
+        import numpy as np
+
+        docs, terms, counts = self.term_counts(texts)
+        w = (1 + np.log(counts)) * self.idf[terms]
+        norm = np.sqrt(np.bincount(docs, w * w, minlength=len(texts)))
+        return docs, terms, (w / norm[docs]).astype(np.float32)
+
+    def score(self, texts):
+        """공고별 (최대 코사인 유사도, 가장 비슷한 직무 번호)
+
+        희소 행렬 곱이 아니라 청크 단위 조밀 곱입니다: 공고 벡터를 청크마다 (공고 수 × 사전 크기) 행렬로 펼쳐
+        직무 행렬과 곱합니다. 사전은 BEP 직무 코퍼스에서만 만들어 작으므로(수천 개) BLAS 조밀 곱이
+        numpy 로 구현한 희소 곱보다 빠르고, 청크 메모리는 COUNT_CELLS × 4byte 로 제한됩니다.
+        """
+        import numpy as np
+
+        scores = np.zeros(len(texts), np.float32)
+        best = np.zeros(len(texts), np.int64)
+        if not len(self.titles) or not self.size:
+            # 직무 코퍼스가 비었거나 n-gram 이 하나도 없으면 모든 공고를 0점(관련 직무 없음)으로
+            print(f"[관련도] 직무 사전이 비어 있어 (직무 {len(self.titles)}개, n-gram {self.size}개) 모든 공고를 0점 처리")
+            return scores, best
+        role_terms = np.ascontiguousarray(self.matrix.T)  # (사전 크기, 직무 수)
+        step = max(1, min(CHUNK_DOCS, COUNT_CELLS // max(self.size, 1)))
+        for start in range(0, len(texts), step):
+            chunk = texts[start:start + step]
+            docs, terms, w = self.weights(chunk)
+            # 청크 크기가 COUNT_CELLS 로 제한되므로 공고 벡터를 조밀 행렬로 펼쳐 한 번에 곱함
+            vectors = np.zeros((len(chunk), self.size), np.float32)
+            vectors[docs, terms] = w
+            sims = vectors @ role_terms
+            scores[start:start + len(chunk)] = sims.max(axis=1)
+            best[start:start + len(chunk)] = sims.argmax(axis=1)
+        return scores, best
+
+def fit_index(titles, texts, key=""):
+    """직무 텍스트로 n-gram 사전과 IDF(smooth), 직무 벡터를 만듭니다."""
+    import numpy as np
+
+    cp, _ = _codepoints(texts)
+    alphabet = np.unique(cp[_word_chars()[cp]]).astype(np.int64)
+    base = len(alphabet) + 2
+    sym = _symbol_table(alphabet)[cp].astype(np.int64)
+
+    # 코퍼스에 나온 모든 2/3-gram 이 사전
+    word = sym > 0
+    bi = sym[:-1] * base + sym[1:]
+    tri = bi[:-1] * base + sym[2:]
+    bigrams = np.unique(bi[word[:-1] & word[1:]])
+    trigrams = np.unique(tri[word[:-2] & word[1:-1] & word[2:]])
+    index = RoleIndex(key, alphabet, bigrams, trigrams, None, None, titles)
+
+    _, terms, _ = index.term_counts(texts)
+    df = np.bincount(terms, minlength=index.size)
+    index.idf = np.log((1 + len(texts)) / (1 + df)) + 1
+    docs, terms, w = index.weights(texts)
+    matrix = np.zeros((len(texts), index.size), np.float32)
+    matrix[docs, terms] = w
+    index.matrix = matrix
+    return index
+
+# =========================================================
+# 3. 직무 코퍼스 / 사전 캐시
+# =========================================================
+
+def load_roles(role_file=ROLE_FILE):
+    """게시중인 BEP 공고의 (공고명 목록, 직무 텍스트 목록). 게시중 공고가 없으면 전체 사용"""
+    import pandas as pd
+
+    df = pd.read_csv(role_file, dtype=str, keep_default_na=False)
+    if df.empty:
+        print(f"[관련도] 직무 코퍼스가 비어 있음: {role_file}")
+        return [], []
+    text = df[[c for c in ROLE_TEXT_COLUMNS if c in df.columns]].agg(" ".join, axis=1).str.strip()
+    open_mask = df["completed_date"].isin(["", "-", "nan"]) if "completed_date" in df.columns else text != ""
+    if not (open_mask & (text != "")).any():
+        print("[관련도] 게시중인 BEP 공고가 없어 전체 공고를 직무 코퍼스로 사용")
+        open_mask = text == text
+    roles = df.loc[open_mask & (text != ""), ["공고명"]].assign(text=text).drop_duplicates("text")
+    return roles["공고명"].tolist(), roles["text"].tolist()
+
+def load_index(role_file=ROLE_FILE, vocab_file=VOCAB_FILE):
+    """직무 코퍼스가 캐시와 같으면 저장된 사전을, 아니면 새로 학습해 저장합니다."""
+    import numpy as np
+
+    titles, texts = load_roles(role_file)
+    key = hashlib.sha256("\x1e".join([str(VOCAB_VERSION), *titles, *texts]).encode("utf-8")).hexdigest()
+    if os.path.exists(vocab_file):
+        try:
+            with np.load(vocab_file, allow_pickle=False) as cached:
+                if str(cached["key"]) == key:
+                    return RoleIndex(key, cached["alphabet"], cached["bigrams"], cached["trigrams"],
+                                     cached["idf"], cached["matrix"], cached["titles"].tolist())
+        except Exception:
+            pass
+
+    start = time.perf_counter()
+    index = fit_index(titles, texts, key)
+    os.makedirs(os.path.dirname(vocab_file), exist_ok=True)
+    with open(vocab_file, "wb") as f:
+        np.savez(f, key=key, alphabet=index.alphabet, bigrams=index.bigrams, trigrams=index.trigrams,
+                 idf=index.idf, matrix=index.matrix, titles=np.array(titles))
+    print(f"[관련도] 사전 학습: 직무 {len(titles)}개, n-gram {index.size}개 ({time.perf_counter() - start:.2f}초)")
+    return index
+
+# =========================================================
+# 4. 경쟁사 CSV 점수 매기기
+# =========================================================
+
+def posting_texts(df):
+    """공고명 + 본문(저장소 원문, 없으면 CSV 의 공고문 컬럼) 앞부분"""
+    from body_store import get_body
+
+    texts = []
+    for title, preview, h in zip(df["공고명"], df["공고문 컬럼"], df.get("본문 해시", [""] * len(df))):
+        body = get_body(h) or preview
+        texts.append(f"{title} {body}"[:MAX_CHARS])
+    return texts
+
+def score_files(files, index, dry_run=False):
+    """여러 CSV 의 공고를 한 번에 벡터화해 관련도 컬럼을 채웁니다."""
+    import pandas as pd
+
+    frames = {}
+    for file_name in files:
+        if not os.path.exists(file_name):
+            print(f"[Skip] 파일 없음: {file_name}")
+            continue
+        # 다른 컬럼은 읽은 그대로 다시 쓰도록 모두 문자열로 읽음
+        frames[file_name] = pd.read_csv(file_name, dtype=str, keep_default_na=False)
+    if not frames:
+        return
+
+    texts = [t for df in frames.values() for t in posting_texts(df)]
+    start = time.perf_counter()
+    scores, best = index.score(texts)
+    print(f"[관련도] 공고 {len(texts)}건 × 직무 {len(index.titles)}개 ({time.perf_counter() - start:.2f}초)")
+
+    offset = 0
+    for file_name, df in frames.items():
+        part = slice(offset, offset + len(df))
+        offset += len(df)
+        df["관련도"] = [f"{s:.3f}" for s in scores[part]]
+        df["관련 BEP 공고"] = [index.titles[b] if s > 0 else "" for s, b in zip(scores[part], best[part])]
+        print(f"[{file_name}] 관련 공고(≥{RELEVANT_SCORE}) {int((scores[part] >= RELEVANT_SCORE).sum())}/{len(df)}건")
+        if not dry_run:
+            df.to_csv(file_name, index=False, encoding="utf-8-sig")
+
+def benchmark(index, count, seed=0):
+    """실제 공고 본문을 섞어 만든 count 건으로 벡터화·점수 시간을 잽니다 (CSV 는 건드리지 않음)."""
+    import random
+    import pandas as pd
+
+    pool = []
+    for file_name in SCORE_FILES:
+        if os.path.exists(file_name):
+            pool.extend(posting_texts(pd.read_csv(file_name, dtype=str, keep_default_na=False)))
+    if not pool:
+        print("[Skip] 벤치마크용 공고가 없습니다")
+        return
+    rng = random.Random(seed)
+    lines = [line for text in pool for line in text.splitlines() if line.strip()]
+    texts = ["\n".join(rng.sample(lines, min(len(lines), 30)))[:MAX_CHARS] for _ in range(count)]
+
+    start = time.perf_counter()
+    scores, _ = index.score(texts)
+    elapsed = time.perf_counter() - start
+    print(f"[벤치마크] 공고 {count}건 ({sum(map(len, texts)) / 1e6:.1f}M자) {elapsed:.2f}초, 평균 점수 {scores.mean():.3f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="경쟁사 공고와 BEP 직무의 TF-IDF 관련도를 일괄 계산합니다.")
+    parser.add_argument("files", nargs="*", default=SCORE_FILES)
+    parser.add_argument("--dry-run", action="store_true", help="CSV를 저장하지 않고 결과만 출력")
+    parser.add_argument("--benchmark", type=int, metavar="N", help="합성 공고 N건으로 속도만 측정")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(ROLE_FILE):
+        print(f"[Skip] 파일 없음: {ROLE_FILE}")
+        return
+    index = load_index()
+    if args.benchmark:
+        benchmark(index, args.benchmark)
+    else:
+        score_files(args.files, index, args.dry_run)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
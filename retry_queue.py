@@ -0,0 +1,168 @@
+import os
+import sys
+import json
+import argparse
+from datetime import datetime, timedelta
+
+try:
+    import fcntl
+except ImportError:  # Windows: 잠금 없이 동작 (단일 프로세스 실행만 안전)
+    fcntl = None
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+RETRY_FILE = "retry_queue.json"  # 실패한 상세 페이지 (실행 사이에 유지, 워크플로가 커밋)
+
+RETRY_BASE_HOURS = 6          # 실패 n회 후 다음 재시도까지 RETRY_BASE_HOURS * 2^(n-1) 시간
+MAX_DELAY_HOURS = 7 * 24      # 재시도 간격 상한
+DUE_SLACK_HOURS = 1           # 매일 실행 시각이 조금 달라도 하루 뒤 재시도가 밀리지 않도록
+CHRONIC_ATTEMPTS = 3          # 이 횟수 이상 실패한 URL은 보고서에 만성 실패로 표시
+MAX_ATTEMPTS = 10             # 이 횟수를 넘으면 재시도하지 않고 보고서에만 남김
+
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# =========================================================
+# 2. 큐 입출력 (여러 워커 프로세스가 함께 쓰므로 파일 잠금 후 읽고-고치고-쓰기)
+# =========================================================
+
+def now():
+    return datetime.now().strftime(TIME_FORMAT)
+
+def load_queue(path=RETRY_FILE):
+    """{url: {site, company, context, reason, attempts, first_failed, last_failed, next_retry}}"""
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+def _update(change, path=RETRY_FILE):
+    """잠금을 잡은 채 큐를 읽어 change(queue) 를 적용하고, 바뀐 경우에만 저장합니다."""
+    with open(path + ".lock", "w") as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        queue = load_queue(path)
+        if change(queue):
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(queue, f, ensure_ascii=False, indent=1, sort_keys=True)
+            os.replace(tmp, path)
+
+def failed(site, url, reason, company, context=None):
+    """실패를 기록하고 다음 재시도 시각을 지수적으로 늦춥니다."""
+    def change(queue):
+        item = queue.get(url) or {"site": site, "company": company, "attempts": 0, "first_failed": now()}
+        item["attempts"] += 1
+        item["reason"] = str(reason).strip().splitlines()[0][:200] if str(reason).strip() else "알 수 없음"
+        item["last_failed"] = now()
+        item["context"] = context or item.get("context") or {}
+        delay = min(RETRY_BASE_HOURS * 2 ** (item["attempts"] - 1), MAX_DELAY_HOURS)
+        item["next_retry"] = (datetime.now() + timedelta(hours=delay)).strftime(TIME_FORMAT) if item["attempts"] < MAX_ATTEMPTS else ""
+        queue[url] = item
+        return True
+    _update(change)
+
+def succeeded(url):
+    """수집에 성공한 URL은 큐에서 뺍니다."""
+    _update(lambda queue: queue.pop(url, None) is not None)
+
+def forget(urls):
+    """URL 들을 큐에서 뺍니다 (마감된 공고 등)."""
+    urls = set(urls)
+
+    def change(queue):
+        gone = urls & set(queue)
+        for url in gone:
+            del queue[url]
+        return bool(gone)
+
+    if urls:
+        _update(change)
+
+def is_due(item, at=None):
+    if not item.get("next_retry"):
+        return False  # MAX_ATTEMPTS 초과: 포기
+    at = datetime.strptime(at or now(), TIME_FORMAT) + timedelta(hours=DUE_SLACK_HOURS)
+    return datetime.strptime(item["next_retry"], TIME_FORMAT) <= at
+
+# =========================================================
+# 3. 스크래퍼 연동
+# =========================================================
+
+def run_detail(site, session, scrape_detail, company, url, context=None):
+    """상세 페이지 하나를 수집합니다. 실패하면 사유와 함께 큐에 기록하고 None 을 반환합니다.
+
+    scrape_detail(session, company, url, **context) 는 공고 dict 를 반환하거나 실패 시 예외를 던집니다.
+    """
+    try:
+        row = scrape_detail(session, company, url, **(context or {}))
+    except Exception as e:
+        print(f"      상세 수집 실패 ({url}): {e}")
+        session.error()
+        failed(site, url, e, company, context)
+        return None
+    session.ok()
+    succeeded(url)
+    return row
+
+def retry_failed(site, session, scrape_detail, since):
+    """실행 끝에서, 이번 실행(since 이후)에 실패했거나 재시도 시각이 된 상세 페이지를 한 번씩 다시 수집합니다.
+
+    반환값: 이번 재시도로 수집한 공고 dict 목록
+    """
+    items = [
+        (url, item) for url, item in load_queue().items()
+        if item["site"] == site and item.get("next_retry") and (item["last_failed"] >= since or is_due(item))
+    ]
+    rows = []
+    if items:
+        print(f"\n[재시도] {site} 상세 페이지 {len(items)}건")
+        for url, item in items:
+            session.check()
+            row = run_detail(site, session, scrape_detail, item["company"], url, item.get("context"))
+            if row:
+                rows.append(row)
+    summary(site)
+    return rows
+
+def summary(site):
+    queue = [item for item in load_queue().values() if item["site"] == site]
+    if queue:
+        chronic = sum(item["attempts"] >= CHRONIC_ATTEMPTS for item in queue)
+        print(f"[재시도 큐] {site}: 남은 실패 {len(queue)}건 (만성 {chronic}건, 상세: python retry_queue.py report)")
+
+# =========================================================
+# 4. 만성 실패 보고서
+# =========================================================
+
+def report(min_attempts=CHRONIC_ATTEMPTS, site=None):
+    """min_attempts 회 이상 실패한 URL을 사이트별로 실패 횟수 순으로 출력합니다."""
+    queue = load_queue()
+    items = [(url, item) for url, item in queue.items() if item["attempts"] >= min_attempts and site in (None, item["site"])]
+    print(f"[재시도 큐] 전체 {len(queue)}건 중 {min_attempts}회 이상 실패 {len(items)}건")
+    for url, item in sorted(items, key=lambda x: (x[1]["site"], -x[1]["attempts"], x[0])):
+        next_retry = item["next_retry"] or "포기"
+        print(
+            f"  [{item['site']}] {item['attempts']:2d}회 {item['company']} | {item['reason']}\n"
+            f"      최초 {item['first_failed']} / 최근 {item['last_failed']} / 다음 {next_retry}  {url}"
+        )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="상세 페이지 재시도 큐를 확인·관리합니다.")
+    parser.add_argument("command", choices=["report", "list", "forget"])
+    parser.add_argument("urls", nargs="*", help="forget: 큐에서 뺄 URL")
+    parser.add_argument("--site")
+    parser.add_argument("--min-attempts", type=int, default=CHRONIC_ATTEMPTS)
+    args = parser.parse_args(argv)
+
+    if args.command == "report":
+        report(args.min_attempts, args.site)
+    elif args.command == "list":
+        report(1, args.site)
+    else:
+        forget(args.urls)
+        print(f"[재시도 큐] {len(args.urls)}건 제거")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
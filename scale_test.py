@@ -0,0 +1,146 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+from standin_server import JobBoard, start_server
+from session_health import process_tree_rss
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 사이트별 (스크립트, 결과 CSV)
+SCRAPERS = {
+    "saramin": ("scraper.py", "saramin_results.csv"),
+    "wanted": ("wanted.py", "wanted_results.csv"),
+    "remember": ("remember.py", "remember_results.csv"),
+    "water": ("water_main.py", "BEP_EV_Recruitment_Master.csv"),
+}
+
+# 가상 사이트는 로컬이므로 실제 사이트보다 빠르게 요청 (초당 요청 수)
+STANDIN_RATE = 20.0
+
+RSS_SAMPLE_SECONDS = 0.2  # 스크래퍼 + chromedriver + Chrome 프로세스 트리 RSS 측정 간격
+
+# =========================================================
+# 2. 측정 함수
+# =========================================================
+
+def dir_size(path):
+    """파일 또는 폴더 전체 크기(byte). 없으면 0"""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return total
+
+def run_scraper(site, workdir, env):
+    """스크래퍼 하나를 별도 프로세스로 실행하고 (소요 시간[초], 최대 RSS[MB], 파이썬 최대 RSS[MB], 종료 코드)를 반환합니다.
+
+    최대 RSS 는 스크래퍼와 그 하위 프로세스(chromedriver, Chrome) 전체 합계를 주기적으로 잰 최댓값입니다.
+    /proc 가 없는 환경에서는 파이썬 프로세스 값만 남습니다.
+    """
+    script, _ = SCRAPERS[site]
+    peak = 0.0
+    with open(os.path.join(workdir, f"{site}.log"), "a", encoding="utf-8") as log:
+        start = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, os.path.join(REPO_DIR, script)], cwd=workdir, env=env, stdout=log, stderr=subprocess.STDOUT)
+        while True:
+            # wait4 로 이 프로세스 하나의 자원 사용량을 받음 (Linux/macOS). 끝나기 전에는 트리 RSS 를 측정
+            pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+            if pid:
+                break
+            peak = max(peak, process_tree_rss(proc.pid) or 0.0)
+            time.sleep(RSS_SAMPLE_SECONDS)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        elapsed = time.perf_counter() - start
+    python_rss = usage.ru_maxrss / 1024
+    return elapsed, max(peak, python_rss), python_rss, proc.returncode
+
+def run_scale(companies, postings, days, churn, sites, rate=STANDIN_RATE, seed=0, workdir=None):
+    """기업 수 하나에 대해 days 일치 크롤링을 돌리고 측정 결과 행 목록을 반환합니다."""
+    board = JobBoard(companies, postings, postings, churn, seed)
+    server, url = start_server(board, port=0)
+    workdir = workdir or tempfile.mkdtemp(prefix=f"scale_{companies}_")
+    env = dict(
+        os.environ,
+        STANDIN_URL=url,
+        CRAWL_ALL="1",
+        CRAWL_COMPANIES=",".join(board.companies),
+        CRAWL_DEFAULT_RATE=str(rate),
+        PYTHONUNBUFFERED="1",
+    )
+
+    rows = []
+    try:
+        for day in range(days):
+            if day:
+                board.advance()
+            open_counts = board.stats()["open"]
+            for site in sites:
+                elapsed, rss, python_rss, code = run_scraper(site, workdir, env)
+                csv_path = os.path.join(workdir, SCRAPERS[site][1])
+                rows.append({
+                    "companies": companies,
+                    "day": day + 1,
+                    "site": site,
+                    "open_postings": open_counts[site],
+                    "seconds": round(elapsed, 2),
+                    "peak_rss_mb": round(rss, 1),
+                    "python_rss_mb": round(python_rss, 1),
+                    "csv_kb": round(dir_size(csv_path) / 1024, 1),
+                    "bodies_kb": round(dir_size(os.path.join(workdir, "bodies")) / 1024, 1),
+                    "exit_code": code,
+                })
+                print_row(rows[-1])
+    finally:
+        server.shutdown()
+    return rows
+
+def print_row(row):
+    print(
+        f"  {row['companies']:>5} {row['day']:>3}일 {row['site']:<9} 공고 {row['open_postings']:>6}  "
+        f"{row['seconds']:>8.1f}초  RSS {row['peak_rss_mb']:>7.1f}MB (파이썬 {row['python_rss_mb']:>6.1f}MB)  CSV {row['csv_kb']:>9.1f}KB  "
+        f"본문 {row['bodies_kb']:>9.1f}KB  종료 {row['exit_code']}"
+    )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="가상 채용 사이트로 실제 스크래퍼를 돌려 규모별 시간/메모리/CSV 크기를 측정합니다.")
+    parser.add_argument("--scales", default="7,25,100", help="쉼표로 구분한 기업 수 목록")
+    parser.add_argument("--postings", type=int, default=20, help="사이트×기업별 공고 수")
+    parser.add_argument("--days", type=int, default=2, help="반복 실행 일수 (2일차부터 churn 적용)")
+    parser.add_argument("--churn", type=float, default=0.1)
+    parser.add_argument("--sites", default=",".join(SCRAPERS))
+    parser.add_argument("--rate", type=float, default=STANDIN_RATE, help="가상 사이트 요청 속도 (초당)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="scale_results.json", help="측정 결과 JSON")
+    parser.add_argument("--keep", action="store_true", help="작업 폴더(CSV, 로그) 남기기")
+    args = parser.parse_args(argv)
+
+    sites = [s for s in args.sites.split(",") if s in SCRAPERS]
+    results = []
+    for companies in [int(n) for n in args.scales.split(",")]:
+        print(f"\n[규모] 기업 {companies}곳 × 공고 {args.postings}건 / {args.days}일")
+        workdir = tempfile.mkdtemp(prefix=f"scale_{companies}_")
+        try:
+            results.extend(run_scale(companies, args.postings, args.days, args.churn, sites, args.rate, args.seed, workdir))
+        finally:
+            if args.keep:
+                print(f"    작업 폴더: {workdir}")
+            else:
+                shutil.rmtree(workdir, ignore_errors=True)
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=1)
+    print(f"\n[저장] {args.out} ({len(results)}행)")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
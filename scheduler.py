@@ -0,0 +1,169 @@
+import os
+import sys
+import json
+import math
+import argparse
+from datetime import datetime, date
+
+from analytics import load_snapshot
+from sites import COMPANIES
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+SCHEDULE_FILE = "crawl_schedule.json"  # 회사×사이트별 마지막 크롤링 날짜
+
+# 사이트별 하루 페이지 로드 예산 (검색 1페이지 + 예상 신규 상세 페이지 수 기준)
+PAGE_BUDGET = {"saramin": 5, "wanted": 5, "remember": 5}
+DEFAULT_BUDGET = 5
+
+# 변화 확률이 이보다 낮으면 예산이 남아도 건너뜀
+MIN_PRIORITY = 0.1
+
+# 변화가 적은 회사라도 이 일수 이상은 건너뛰지 않음 (최대 지연 보장)
+MAX_STALENESS_DAYS = 3
+
+# 회사별 최대 지연: 건너뛰는 동안 놓칠 것으로 예상되는 신규 공고 수가 이 값을 넘지 않는 일수
+# (신규 공고가 잦은 회사는 매일, 이력이 충분하고 드문 회사만 MAX_STALENESS_DAYS 까지 늦춤)
+MISSED_POSTINGS = 0.05
+
+# 처음 공고를 본 뒤 이 일수가 지나기 전(공고를 본 적 없는 회사 포함)에는 매일 크롤링
+MIN_HISTORY_DAYS = 14
+
+# 변화율 추정: 최근 LOOKBACK_DAYS 동안의 등록/마감 이벤트 수 + 사전값
+# 사전값은 사이트 전체의 회사당 일 평균을 PRIOR_DAYS 일 분량만큼 섞음 (사이트 이력이 없으면 PRIOR_EVENTS / 기간)
+LOOKBACK_DAYS = 90
+PRIOR_EVENTS = 1
+PRIOR_DAYS = 14
+
+# CRAWL_ALL=1 이면 스케줄러를 끄고 모든 회사를 크롤링 (수동 실행용)
+CRAWL_ALL = os.environ.get("CRAWL_ALL") == "1"
+
+# =========================================================
+# 2. 상태 입출력
+# =========================================================
+
+def load_schedule(path=SCHEDULE_FILE):
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+def save_schedule(schedule, path=SCHEDULE_FILE):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(schedule, f, ensure_ascii=False, indent=1, sort_keys=True)
+
+# =========================================================
+# 3. 변화율 추정 및 우선순위
+# =========================================================
+
+def change_rates(site, companies, today, snapshot=None):
+    """회사별 (일 평균 변화 이벤트 수, 일 평균 신규 공고 수, 관측 일수)를 first-seen/completed_date 이력으로 추정
+
+    관측 일수는 그 회사 공고를 처음 본 날부터 (최대 LOOKBACK_DAYS). 이력이 짧을수록 사이트 평균 사전값에 가까워져,
+    공고를 아직 못 봤다는 이유만으로 조용한 회사로 취급하지 않습니다.
+    """
+    snapshot = snapshot if snapshot is not None else load_snapshot()
+    events = {c: 0 for c in companies}
+    new = {c: 0 for c in companies}
+    since = {}
+    recent = lambda day: bool(day) and (today - date.fromisoformat(day)).days <= LOOKBACK_DAYS
+    for p_site, company, first_seen, completed in snapshot["postings"].values():
+        if p_site != site or company not in events:
+            continue
+        if first_seen:
+            since[company] = min(since.get(company, first_seen), first_seen)
+        if recent(first_seen):
+            events[company] += 1
+            new[company] += 1
+        if recent(completed):
+            events[company] += 1
+
+    observed = {c: min(LOOKBACK_DAYS, (today - date.fromisoformat(since[c])).days) if c in since else 0 for c in companies}
+
+    # 사이트 전체의 회사당 일 평균 (관측 기간 = 가장 오래 본 회사 기준)
+    site_days = max([*observed.values(), 1]) * max(1, len(companies))
+    default_prior = PRIOR_EVENTS / (LOOKBACK_DAYS + PRIOR_DAYS)
+    prior_events = sum(events.values()) / site_days if any(events.values()) else default_prior
+    prior_new = sum(new.values()) / site_days if any(new.values()) else default_prior
+
+    return {
+        c: (
+            (events[c] + prior_events * PRIOR_DAYS) / (observed[c] + PRIOR_DAYS),
+            (new[c] + prior_new * PRIOR_DAYS) / (observed[c] + PRIOR_DAYS),
+            observed[c],
+        )
+        for c in companies
+    }
+
+def max_staleness(new_rate, observed_days=LOOKBACK_DAYS):
+    """일 평균 신규 공고 수로 정한 회사별 최대 지연 일수 (1 ~ MAX_STALENESS_DAYS)
+
+    이력이 MIN_HISTORY_DAYS 보다 짧으면 1 (매일 크롤링).
+    """
+    if observed_days < MIN_HISTORY_DAYS:
+        return 1
+    return max(1, min(MAX_STALENESS_DAYS, int(MISSED_POSTINGS / new_rate)))
+
+def plan_companies(site, companies, budget=None, today=None, snapshot=None):
+    """이번 실행에서 검색할 회사 목록을 우선순위 큐로 결정합니다.
+
+    - 마지막 크롤링 후 max_staleness() 일 이상 지난 회사는 예산과 무관하게 포함
+    - 나머지는 '그동안 변화가 있었을 확률' 1 - exp(-λt) 가 높은 순으로 예산 안에서 선택
+      (MIN_PRIORITY 미만은 제외)
+    """
+    if CRAWL_ALL:
+        return list(companies)
+
+    today = today or date.today()
+    budget = budget if budget is not None else PAGE_BUDGET.get(site, DEFAULT_BUDGET)
+    schedule = load_schedule()
+    rates = change_rates(site, companies, today, snapshot)
+
+    queue = []
+    for company in companies:
+        last = schedule.get(f"{site}|{company}")
+        days = (today - date.fromisoformat(last)).days if last else None
+        rate, new_rate, observed = rates[company]
+        if days is not None and days <= 0:
+            continue  # 오늘 이미 크롤링함
+        forced = days is None or days >= max_staleness(new_rate, observed)
+        priority = 1.0 if days is None else 1 - math.exp(-rate * days)
+        cost = 1 + (new_rate * days if days else 1)
+        queue.append((not forced, -priority, cost, company))
+
+    selected, spent = [], 0.0
+    for not_forced, neg_priority, cost, company in sorted(queue):
+        if not_forced and (spent + cost > budget or -neg_priority < MIN_PRIORITY):
+            continue
+        selected.append(company)
+        spent += cost
+        print(f"    [스케줄] {site}/{company} 우선순위 {-neg_priority:.2f} 예상 {cost:.1f}페이지{'' if not_forced else ' (최대 지연 도달)'}")
+
+    skipped = [c for c in companies if c not in selected]
+    if skipped:
+        print(f"    [스케줄] 이번 실행 제외: {', '.join(skipped)}")
+    return selected
+
+def mark_crawled(site, companies, today=None):
+    """검색을 끝까지 마친 회사의 마지막 크롤링 날짜를 기록합니다 (실패한 회사는 다음 실행에서 다시 계획)."""
+    today = (today or date.today()).isoformat()
+    schedule = load_schedule()
+    for company in companies:
+        schedule[f"{site}|{company}"] = today
+    save_schedule(schedule)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="오늘 크롤링할 회사×사이트 계획을 출력합니다 (상태는 바꾸지 않음).")
+    parser.add_argument("--site", action="append", choices=list(PAGE_BUDGET))
+    parser.add_argument("--companies", default=",".join(COMPANIES))
+    args = parser.parse_args(argv)
+
+    snapshot = load_snapshot()
+    for site in args.site or list(PAGE_BUDGET):
+        print(f"[{site}] {datetime.now().strftime('%Y-%m-%d')} 계획")
+        plan_companies(site, args.companies.split(","), snapshot=snapshot)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
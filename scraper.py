@@ -1,17 +1,23 @@
-import time
-import pandas as pd
-import os
-import requests
 import sys
 from datetime import datetime
-from urllib.parse import urlparse, parse_qs
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs, urljoin
 
 # Selenium 관련
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
+
+from competitor_csv import load_results, has_body, upsert_rows, upsert_retried, save_results
+from session_health import BrowserSession
+from scheduler import plan_companies
+from rate_limiter import OK, THROTTLED, limiter, browser_get, check_page, http_signal
+from sites import site_url, target_companies
+from retry_queue import now, run_detail, retry_failed
+
+# 검색 결과 페이지 크기 (recruitPageCount). 한 페이지가 이보다 적으면 마지막 페이지
+SEARCH_PAGE_SIZE = 40
+MAX_SEARCH_PAGES = 20    # 기업당 최대 검색 페이지 수
+PAGE_FETCH_WORKERS = 3   # 2페이지부터 동시에 받는 최대 페이지 수 (1 → 2 → 3 으로 늘려 조기 종료 시 낭비를 줄임)
 
 def clean_saramin_url(url):
     """URL에서 고유 공고 번호만 추출하여 정제합니다."""
@@ -19,135 +25,231 @@ def clean_saramin_url(url):
     u = urlparse(url)
     query = parse_qs(u.query)
     if 'rec_idx' in query:
-        return f"https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx={query['rec_idx'][0]}"
+        return site_url("saramin", f"/zf_user/jobs/relay/view?rec_idx={query['rec_idx'][0]}")
     return url
 
-def scrape_saramin():
-    companies = ["대영채비", "이브이시스", "플러그링크", "볼트업", "차지비", "에버온","일렉링크"]
-    csv_file = "saramin_results.csv"
-    today = datetime.now().strftime('%Y-%m-%d')
-    
-    # 1. 컬럼 구조 설정 ('경력' 컬럼을 3번째 자리에 추가)
-    columns = ["기업명", "공고명", "경력", "공고문 컬럼", "이미지 링크", "URL", "first-seen", "completed_date"]
-    
-    # 기존 데이터 로드 및 구조 맞추기
-    if os.path.exists(csv_file):
-        df_old = pd.read_csv(csv_file)
-        # 컬럼 순서나 이름이 다를 경우를 대비해 재설정
-        for col in columns:
-            if col not in df_old.columns:
-                df_old[col] = ""
-        df_old = df_old[columns]
-    else:
-        df_old = pd.DataFrame(columns=columns)
-
-    # 2. 브라우저 설정
+def build_options():
+    """Chrome 실행 옵션"""
     options = Options()
     options.add_argument("--headless")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    return options
+
+def search_url(target_company, page):
+    return site_url("saramin", f"/zf_user/search/recruit?searchword={target_company}&recruitPage={page}&recruitPageCount={SEARCH_PAGE_SIZE}")
+
+def parse_search_page(html, target_company, page_url):
+    """검색 결과 HTML → (대상 기업 공고 [(link, title, experience), ...], 페이지의 전체 공고 수)"""
+    from bs4 import BeautifulSoup
+
+    items = BeautifulSoup(html, "html.parser").select(".item_recruit")
+    matches = []
+    for item in items:
+        try:
+            # 기업명 매칭 확인
+            corp_name = item.select_one(".corp_name").get_text(strip=True).replace(" ", "")
+            if target_company not in corp_name:
+                continue
+            anchor = item.select_one(".job_tit a")
+            link = clean_saramin_url(urljoin(page_url, anchor["href"]))
+
+            # 검색 결과 페이지에서 바로 경력 정보 추출
+            # .job_condition 안의 두 번째 span이 주로 경력 정보입니다.
+            condition_spans = item.select(".job_condition span")
+            experience = condition_spans[1].get_text(strip=True) if len(condition_spans) > 1 else "정보없음"
+
+            matches.append((link, anchor.get_text(" ", strip=True), experience))
+        except Exception as e:
+            print(f"      세부 오류: {e}")
+    return matches, len(items)
+
+def fetch_search_pages(driver, target_company, pages):
+    """검색 페이지들을 HTTP 로 동시에 받아 [(page, url, html 또는 None), ...] (페이지 순서)로 반환합니다.
+
+    브라우저 쿠키/User-Agent 를 그대로 쓰고, 브라우저와 같은 호스트 속도 제한을 지킵니다.
+    """
+    import requests
+
+    session = requests.Session()
+    session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent")
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+
+    def _fetch(page):
+        url = search_url(target_company, page)
+        limiter.wait(url)
+        try:
+            response = session.get(url, timeout=15)
+        except Exception as e:
+            print(f"    ({page}페이지 요청 실패: {e})")
+            return page, url, None
+        signal = http_signal(response.status_code, response.text)
+        limiter.report(url, signal)
+        if signal == THROTTLED or response.status_code != 200:
+            return page, url, None
+        return page, url, response.text
+
+    with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+        results = list(executor.map(_fetch, pages))
+    session.close()
+    return results
+
+def search_company(driver, target_company):
+    """1페이지부터 대상 기업 공고가 나오는 동안 검색 결과를 읽습니다.
+
+    첫 페이지는 브라우저로 열고, 이후 페이지는 한 번에 1, 2, ... PAGE_FETCH_WORKERS 개씩 동시에 받습니다.
+    대상 기업 공고가 없는 페이지나 마지막(덜 찬) 페이지에서 멈춥니다.
+    반환값: (rec_idx 기준으로 중복을 제거한 {link: (title, experience)}, 검색 완료 여부)
+    요청 실패/차단 신호나 MAX_SEARCH_PAGES 때문에 멈췄으면 뒤 페이지 공고를 못 봤으므로 완료가 아닙니다.
+    """
+    url = search_url(target_company, 1)
+    signal = browser_get(driver, url, ready=(By.CSS_SELECTOR, ".item_recruit"))
+    if signal == THROTTLED:
+        print("    (차단 신호: 이번 실행에서 이 기업은 마감 처리하지 않음)")
+        return {}, False
+    if signal != OK:
+        print("    (검색 결과 없음)")
+    matches, count = parse_search_page(driver.page_source, target_company, url)
+
+    found = {}
+    for link, title, experience in matches:
+        found.setdefault(link, (title, experience))
+
+    pages_read = 1
+    last_page = MAX_SEARCH_PAGES
+    next_page = 2
+    batch = 1
+    done = not matches or count < SEARCH_PAGE_SIZE
+    complete = True
+    while not done and next_page <= last_page:
+        window = range(next_page, min(next_page + batch, last_page + 1))
+        next_page = window[-1] + 1
+        batch = min(batch * 2, PAGE_FETCH_WORKERS)
+        # 동시에 받은 페이지를 순서대로 읽고, 멈출 페이지를 만나면 나머지는 버림
+        for _, page_url, html in fetch_search_pages(driver, target_company, window):
+            if html is None:
+                done, complete = True, False  # 요청 실패/차단: 이후 페이지는 확인하지 않음
+                break
+            pages_read += 1
+            matches, count = parse_search_page(html, target_company, page_url)
+            for link, title, experience in matches:
+                found.setdefault(link, (title, experience))
+            if not matches or count < SEARCH_PAGE_SIZE:
+                done = True
+                break
+
+    if not done:
+        complete = False  # MAX_SEARCH_PAGES 까지 모두 가득 찬 페이지
+    print(f"    (검색 {pages_read}페이지, 대상 공고 {len(found)}개 발견{'' if complete else ', 검색 미완료'})")
+    return found, complete
+
+def scrape_company(session, target_company, df_old):
+    """기업 하나의 검색 결과(모든 페이지)를 수집합니다.
+
+    반환값: (수집한 공고 dict 목록, 검색에서 확인한 URL 목록, 검색 완료 여부).
+    df_old 는 이미 수집된 공고 확인용으로만 읽습니다.
+    """
+    rows = []
+    print(f"\n>>> {target_company} 검색 시작...")
+    found, complete = search_company(session.driver, target_company)
+    scraped_urls = list(found)
+
+    # 이미 수집된 URL이고 데이터가 차 있다면 스킵 (업데이트가 필요한 경우 주석 처리)
+    targets = [(link, title, experience) for link, (title, experience) in found.items() if not has_body(df_old, link, 20)]
+
+    for link, title, experience in targets:
+        # 공고 사이에서만 세션 점검 (메모리/오류 임계값 초과 시 재시작)
+        session.check()
+        # 실패하면 재시도 큐에 기록되고 실행 끝/다음 실행에서 다시 시도
+        row = run_detail("saramin", session, scrape_detail, target_company, link, {"title": title, "experience": experience})
+        if row:
+            rows.append(row)
+
+    return rows, scraped_urls, complete
+
+def scrape_detail(session, target_company, link, title, experience):
+    """상세 페이지 하나를 수집해 공고 dict 를 반환합니다 (실패 시 예외)."""
+    driver = session.driver
+    try:
+        print(f"    - 데이터 수집 중: {title[:20]}... ({experience})")
+
+        # 상세페이지 이동 (텍스트 및 이미지 추출용): 상세 탭 하나를 재사용
+        limiter.wait(link)
+        session.open_detail(link)
+        check_page(driver, link, empty_signal=False)
+
+        raw_text = ""
+        image_links = []
+
+        # 상세 공고문 내용 추출 (Iframe 우선)
+        if len(driver.find_elements(By.ID, "iframe_content_0")) > 0:
+            driver.switch_to.frame("iframe_content_0")
+            body_element = driver.find_element(By.TAG_NAME, "body")
+            raw_text = body_element.text.strip()
+            imgs = body_element.find_elements(By.TAG_NAME, "img")
+            image_links = [i.get_attribute("src") for i in imgs if i.get_attribute("src")]
+            driver.switch_to.default_content()
+        else:
+            # Iframe이 없는 경우
+            raw_text = driver.find_element(By.TAG_NAME, "body").text.strip()[:5000]
+
+        return {
+            "기업명": target_company, 
+            "공고명": title, 
+            "경력": experience,
+            "공고문 컬럼": raw_text, 
+            "이미지 링크": "|".join(image_links), 
+            "URL": link,
+        }
+    finally:
+        session.back_to_main()
+
+def scrape_saramin():
+    companies = target_companies()
+    today = datetime.now().strftime('%Y-%m-%d')
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    scraped_urls = []
+    # 1. 기존 데이터 로드 및 구조 맞추기
+    df_old = load_results("saramin")
 
-    try:
-        for target_company in companies:
-            print(f"\n>>> {target_company} 검색 시작...")
-            driver.get(f"https://www.saramin.co.kr/zf_user/search/recruit?searchword={target_company}")
-            time.sleep(4) 
-
-            items = driver.find_elements(By.CSS_SELECTOR, ".item_recruit")
-            print(f"    (검색 결과 {len(items)}개 발견)")
-
-            for item in items:
-                try:
-                    # 기업명 매칭 확인
-                    corp_name = item.find_element(By.CSS_SELECTOR, ".corp_name").text.replace(" ", "")
-                    if target_company not in corp_name:
-                        continue
-                    
-                    raw_link = item.find_element(By.CSS_SELECTOR, ".job_tit a").get_attribute("href")
-                    link = clean_saramin_url(raw_link)
-                    scraped_urls.append(link)
-
-                    # 검색 결과 페이지에서 바로 경력 정보 추출
-                    try:
-                        # .job_condition 안의 두 번째 span이 주로 경력 정보입니다.
-                        condition_spans = item.find_elements(By.CSS_SELECTOR, ".job_condition span")
-                        experience = condition_spans[1].text if len(condition_spans) > 1 else "정보없음"
-                    except:
-                        experience = "정보없음"
-
-                    # 이미 수집된 URL이고 데이터가 차 있다면 스킵 (업데이트가 필요한 경우 주석 처리)
-                    if link in df_old['URL'].values:
-                        idx = df_old[df_old['URL'] == link].index[0]
-                        if pd.notna(df_old.at[idx, '공고문 컬럼']) and len(str(df_old.at[idx, '공고문 컬럼'])) > 20:
-                            continue
-
-                    title = item.find_element(By.CSS_SELECTOR, ".job_tit a").text.strip()
-                    print(f"    - 데이터 수집 중: {title[:20]}... ({experience})")
-
-                    # 상세페이지 이동 (텍스트 및 이미지 추출용)
-                    driver.execute_script(f"window.open('{link}');")
-                    driver.switch_to.window(driver.window_handles[1])
-                    time.sleep(5)
-
-                    raw_text = ""
-                    image_links = []
-                    
-                    # 상세 공고문 내용 추출 (Iframe 우선)
-                    if len(driver.find_elements(By.ID, "iframe_content_0")) > 0:
-                        driver.switch_to.frame("iframe_content_0")
-                        body_element = driver.find_element(By.TAG_NAME, "body")
-                        raw_text = body_element.text.strip()
-                        imgs = body_element.find_elements(By.TAG_NAME, "img")
-                        image_links = [i.get_attribute("src") for i in imgs if i.get_attribute("src")]
-                        driver.switch_to.default_content()
-                    else:
-                        # Iframe이 없는 경우
-                        raw_text = driver.find_element(By.TAG_NAME, "body").text.strip()[:5000]
-
-                    image_links_str = "|".join(image_links)
-                    
-                    # 데이터 저장
-                    if link in df_old['URL'].values:
-                        t_idx = df_old[df_old['URL'] == link].index[0]
-                        df_old.at[t_idx, '경력'] = experience
-                        df_old.at[t_idx, '공고문 컬럼'] = raw_text
-                        df_old.at[t_idx, '이미지 링크'] = image_links_str
-                    else:
-                        new_row = pd.DataFrame([{
-                            "기업명": target_company, 
-                            "공고명": title, 
-                            "경력": experience,
-                            "공고문 컬럼": raw_text, 
-                            "이미지 링크": image_links_str, 
-                            "URL": link, 
-                            "first-seen": today,
-                            "completed_date": ""
-                        }])
-                        df_old = pd.concat([df_old, new_row], ignore_index=True)
-                    
-                    driver.close()
-                    driver.switch_to.window(driver.window_handles[0])
-                except Exception as e:
-                    print(f"      세부 오류: {e}")
-                    if len(driver.window_handles) > 1:
-                        driver.close()
-                        driver.switch_to.window(driver.window_handles[0])
+    # 2. 브라우저 설정
+    # 변화율 기반으로 이번 실행에서 검색할 회사 선택
+    companies = plan_companies("saramin", companies)
+    if not companies:
+        print("[스케줄] 오늘 검색할 회사가 없습니다.")
+        return
 
-    finally:
-        driver.quit()
+    scraped_urls, searched = [], []
+    run_start = now()
+
+    with BrowserSession(build_options) as session:
+        for target_company in companies:
+            session.check()
+            try:
+                rows, urls, complete = scrape_company(session, target_company, df_old)
+            except Exception as e:
+                print(f"    [실패] {target_company} 검색 중단: {e}")
+                session.restart(f"검색 실패: {e}")
+                continue
+            # 데이터 저장 (Upsert)
+            df_old = upsert_rows(df_old, rows, today, reopen=False)
+            scraped_urls.extend(urls)
+            if complete:
+                searched.append(target_company)
+
+        # 이번 실행에서 실패했거나 재시도 시각이 된 상세 페이지 재수집
+        rows = retry_failed("saramin", session, scrape_detail, run_start)
+        df_old = upsert_retried(df_old, rows, scraped_urls, today, reopen=False)
 
     # 3. 마감 처리 및 CSV 저장
-    mask = (~df_old['URL'].isin(scraped_urls)) & (df_old['completed_date'].isna() | (df_old['completed_date'] == ""))
-    df_old.loc[mask, 'completed_date'] = today
-    
-    # 컬럼 순서 최종 고정 후 저장
-    df_old = df_old[columns]
-    df_old.to_csv(csv_file, index=False, encoding="utf-8-sig")
+    # 검색을 끝까지 마치지 못한 기업은 마감 처리/스케줄 기록에서 제외
+    save_results("saramin", df_old, scraped_urls, searched, today)
     print(f"\n[작업 완료] '경력' 정보가 포함된 {len(scraped_urls)}개의 공고 데이터를 저장했습니다.")
 
 if __name__ == "__main__":
-    scrape_saramin()
+    if "--startup-profile" in sys.argv:
+        from startup_profile import report
+        report("scraper", build_options())
+    else:
+        scrape_saramin()
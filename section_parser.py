@@ -0,0 +1,142 @@
+import re
+import os
+import sys
+import time
+import bisect
+import argparse
+import pandas as pd
+
+# =========================================================
+# 1. 섹션 키워드 설정
+# =========================================================
+
+# (섹션 컬럼, 제목 키워드) - 앞에 있을수록 우선순위가 높습니다.
+# 섹션이 None 인 키워드를 만나면 현재 섹션 수집을 멈춥니다 (복지/지원 버튼 등).
+SECTION_KEYWORDS = [
+    ("주요업무", ["주요 업무", "주요업무", "무슨 일을", "담당 업무", "담당업무"]),
+    ("지원자격", ["지원 자격", "지원자격", "자격 요건", "자격요건", "찾습니다"]),
+    ("우대사항", ["우대 사항", "우대사항", "더 좋습니다"]),
+    ("채용절차", ["채용 절차", "채용절차", "전형 절차", "전형절차", "채용 전형"]),
+    ("근무지", ["근무지", "근무 위치"]),
+    (None, ["복지", "혜택", "지원하기"]),
+]
+
+SECTION_COLUMNS = [section for section, _ in SECTION_KEYWORDS if section]
+
+# 제목으로 인정할 최대 줄 길이 (본문 문장 속 키워드를 제목으로 오인하지 않도록)
+MAX_HEADING_LEN = 40
+
+# 배치 모드에서 다시 파싱할 경쟁사 CSV
+COMPETITOR_FILES = ["saramin_results.csv", "wanted_results.csv", "remember_results.csv"]
+BODY_COL = "공고문 컬럼"
+
+_KEYWORD_PRIORITY = {}
+for _priority, (_section, _keywords) in enumerate(SECTION_KEYWORDS):
+    for _kw in _keywords:
+        _KEYWORD_PRIORITY.setdefault(_kw, _priority)
+
+# 모든 키워드를 하나의 정규식으로 묶어 본문 전체를 한 번만 스캔합니다.
+# 긴 키워드를 먼저 두어 같은 위치에서는 가장 긴 키워드가 매칭되도록 합니다.
+_HEADING_RE = re.compile("|".join(re.escape(kw) for kw in sorted(_KEYWORD_PRIORITY, key=len, reverse=True)))
+
+# =========================================================
+# 2. 파싱 함수
+# =========================================================
+
+def _heading_hits(text, line_starts):
+    """본문 전체를 한 번 스캔해 {줄 번호: 최우선 섹션 인덱스}를 반환합니다."""
+    hits = {}
+    for m in _HEADING_RE.finditer(text):
+        line_no = bisect.bisect_right(line_starts, m.start()) - 1
+        priority = _KEYWORD_PRIORITY[m.group(0)]
+        if line_no not in hits or priority < hits[line_no]:
+            hits[line_no] = priority
+    return hits
+
+def parse_sections(text):
+    """공고 본문(문자열 또는 줄 리스트)을 섹션 컬럼별 텍스트로 나눕니다."""
+    sections = {col: "" for col in SECTION_COLUMNS}
+    if isinstance(text, (list, tuple)):
+        text = "\n".join(text)
+    if not isinstance(text, str) or not text:
+        return sections
+
+    lines = text.split("\n")
+    line_starts = [0]
+    for line in lines[:-1]:
+        line_starts.append(line_starts[-1] + len(line) + 1)
+    hits = _heading_hits(text, line_starts)
+
+    curr = None
+    for line_no, line in enumerate(lines):
+        line = line.strip()
+        if not line: continue
+        if line_no in hits and len(line) <= MAX_HEADING_LEN:
+            curr = SECTION_KEYWORDS[hits[line_no]][0]
+        elif curr:
+            sections[curr] += line + "\n"
+    return sections
+
+def fill_section_columns(df, body_col=BODY_COL, rows=None):
+    """DataFrame의 본문 컬럼을 파싱해 섹션 컬럼을 채웁니다 (배치 처리).
+
+    rows: 이 불리언 마스크의 행만 다시 파싱 (나머지 행의 섹션은 그대로 둠)
+    """
+    for col in SECTION_COLUMNS:
+        # 빈 컬럼은 CSV 에서 float 로 읽히므로 문자열을 넣을 수 있게 object 로
+        df[col] = df[col].astype(object) if col in df.columns else ""
+    target = df.index if rows is None else df.index[rows]
+    parsed = [parse_sections(body) for body in df.loc[target, body_col].tolist()]
+    for col in SECTION_COLUMNS:
+        df.loc[target, col] = [p[col] for p in parsed]
+    return df
+
+# =========================================================
+# 3. 배치 모드 (기존 CSV 전체 재파싱)
+# =========================================================
+
+def reparse_csv(file_name, dry_run=False):
+    """CSV 하나의 본문(저장소에서 복원)을 재파싱하고 (DataFrame, 본문 바이트, 소요 시간)을 반환합니다.
+
+    섹션은 CSV 가 아니라 저장소의 본문 옆 파일에 다시 씁니다 (키워드를 바꾼 뒤 갱신용).
+    """
+    from body_store import HASH_COL, load_bodies, put_sections
+    df = load_bodies(pd.read_csv(file_name, encoding="utf-8-sig"))
+    if BODY_COL not in df.columns:
+        print(f"[Skip] 본문 컬럼 없음: {file_name}")
+        return df, 0, 0.0
+
+    body_bytes = int(df[BODY_COL].fillna("").astype(str).str.encode("utf-8").str.len().sum())
+    start = time.perf_counter()
+    fill_section_columns(df)
+    elapsed = time.perf_counter() - start
+
+    if not dry_run and HASH_COL in df.columns:
+        has_body = df[HASH_COL].fillna("").astype(str).ne("") & df[BODY_COL].fillna("").astype(str).ne("")
+        for h, sections in zip(df.loc[has_body, HASH_COL], df.loc[has_body, SECTION_COLUMNS].to_dict("records")):
+            put_sections(h, sections)
+    return df, body_bytes, elapsed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="공고 본문을 섹션 컬럼으로 일괄 재파싱하고 처리량을 측정합니다.")
+    parser.add_argument("files", nargs="*", default=COMPETITOR_FILES)
+    parser.add_argument("--dry-run", action="store_true", help="섹션 파일을 저장하지 않고 처리량만 측정")
+    args = parser.parse_args(argv)
+
+    total_rows, total_bytes, total_time = 0, 0, 0.0
+    for file_name in args.files:
+        if not os.path.exists(file_name):
+            print(f"[Skip] 파일 없음: {file_name}")
+            continue
+        df, body_bytes, elapsed = reparse_csv(file_name, dry_run=args.dry_run)
+        rows = len(df)
+        total_rows += rows
+        total_bytes += body_bytes
+        total_time += elapsed
+        print(f"[{file_name}] {rows}행 / {body_bytes / 1024:.1f}KB 파싱 {elapsed * 1000:.1f}ms")
+
+    if total_time > 0:
+        print(f"\n[처리량] {total_rows / total_time:,.0f}행/초, {total_bytes / 1024 / 1024 / total_time:.1f}MB/초")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
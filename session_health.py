@@ -0,0 +1,165 @@
+import os
+
+from driver_setup import create_driver
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+MAX_RSS_MB = 1500    # chromedriver + Chrome 프로세스 전체 RSS 가 이를 넘으면 재시작
+MAX_ERRORS = 5       # 연속 오류가 이 횟수에 도달하면 재시작 (세션이 망가진 경우)
+MAX_PAGES = 300      # 세션당 페이지 로드 수 상한 (Chrome 메모리 누적 방지)
+RSS_CHECK_EVERY = 10 # RSS 는 N페이지마다 측정 (/proc 읽기 비용)
+
+# =========================================================
+# 2. 프로세스 메모리 측정 (Linux /proc, 그 외 환경에서는 None)
+# =========================================================
+
+def _parent_map():
+    """{pid: ppid} (모든 프로세스)"""
+    parents = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", "r") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # 두 번째 필드(comm)에 공백/괄호가 있을 수 있어 마지막 ')' 뒤부터 파싱
+        parents[int(name)] = int(stat.rsplit(")", 1)[1].split()[1])
+    return parents
+
+def process_tree_rss(pid):
+    """pid 와 모든 하위 프로세스의 RSS 합계(MB)"""
+    if not os.path.isdir("/proc"):
+        return None
+    parents = _parent_map()
+    tree, frontier = {pid}, [pid]
+    while frontier:
+        current = frontier.pop()
+        children = [child for child, parent in parents.items() if parent == current]
+        tree.update(children)
+        frontier.extend(children)
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    for p in tree:
+        try:
+            with open(f"/proc/{p}/statm", "r") as f:
+                total += int(f.read().split()[1]) * page_size
+        except OSError:
+            continue
+    return total / (1024 * 1024)
+
+# =========================================================
+# 3. 브라우저 세션
+# =========================================================
+
+class BrowserSession:
+    """드라이버 하나의 상태(창 핸들, 메모리, 오류)를 관리하고 필요하면 투명하게 재시작합니다.
+
+    수집 결과는 호출하는 쪽이 들고 있으므로, check() 는 공고와 공고 사이에서만 호출합니다.
+    재시작 후에는 session.driver 를 다시 읽어야 합니다.
+    heartbeat 를 지정하면 check() 때마다 호출합니다 (작업 큐의 임대 연장 등).
+    """
+
+    def __init__(self, build_options, max_rss_mb=MAX_RSS_MB, max_errors=MAX_ERRORS, max_pages=MAX_PAGES):
+        self.build_options = build_options  # 재시작마다 새 옵션 객체 사용
+        self.max_rss_mb = max_rss_mb
+        self.max_errors = max_errors
+        self.max_pages = max_pages
+        self.restarts = 0
+        self.peak_rss_mb = 0.0
+        self.driver = None
+        self.heartbeat = None
+        self.start()
+
+    def start(self):
+        self.driver = create_driver(self.build_options())
+        self.main_handle = self.driver.current_window_handle
+        self.detail_handle = None
+        self.pages = 0
+        self.errors = 0
+
+    def quit(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+    def restart(self, reason):
+        print(f"    [세션] 드라이버 재시작: {reason}")
+        self.quit()
+        self.start()
+        self.restarts += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.rss_mb()
+        self.quit()
+        print(f"    [세션] 재시작 {self.restarts}회, Chrome 최대 RSS {self.peak_rss_mb:.0f}MB")
+
+    # ----- 탭 관리 -----
+
+    def open_detail(self, url):
+        """상세 페이지 전용 탭 하나를 재사용해 url 을 엽니다 (새 창을 계속 열지 않음)."""
+        if self.detail_handle not in self.driver.window_handles:
+            self.driver.switch_to.new_window("tab")
+            self.detail_handle = self.driver.current_window_handle
+        else:
+            self.driver.switch_to.window(self.detail_handle)
+        self.driver.get(url)
+
+    def back_to_main(self):
+        """목록 탭으로 돌아가고, 메인/상세 탭 외에 남은 창은 닫습니다."""
+        try:
+            for handle in self.driver.window_handles:
+                if handle not in (self.main_handle, self.detail_handle):
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+            self.driver.switch_to.default_content()
+            self.driver.switch_to.window(self.main_handle)
+        except Exception:
+            self.errors += 1
+
+    # ----- 상태 기록 / 점검 -----
+
+    def ok(self):
+        self.pages += 1
+        self.errors = 0
+
+    def error(self):
+        self.pages += 1
+        self.errors += 1
+
+    def rss_mb(self):
+        try:
+            rss = process_tree_rss(self.driver.service.process.pid)
+        except Exception:
+            return None
+        if rss is not None:
+            self.peak_rss_mb = max(self.peak_rss_mb, rss)
+        return rss
+
+    def check(self):
+        """임계값을 넘었으면 드라이버를 재시작합니다. 반환값: 재시작했으면 True"""
+        if self.heartbeat is not None:
+            self.heartbeat()
+        reason = None
+        if self.errors >= self.max_errors:
+            reason = f"연속 오류 {self.errors}회"
+        elif self.pages >= self.max_pages:
+            reason = f"페이지 {self.pages}개 처리"
+        elif self.pages and self.pages % RSS_CHECK_EVERY == 0:
+            rss = self.rss_mb()
+            if rss is not None and rss > self.max_rss_mb:
+                reason = f"Chrome RSS {rss:.0f}MB"
+        if reason:
+            self.restart(reason)
+            return True
+        return False
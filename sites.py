@@ -0,0 +1,41 @@
+import os
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+# 경쟁사 검색 대상 기업 (사람인/원티드/리멤버 공통)
+COMPANIES = ["대영채비", "이브이시스", "플러그링크", "볼트업", "차지비", "에버온", "일렉링크"]
+
+# 실제 사이트 주소
+BASE_URLS = {
+    "saramin": "https://www.saramin.co.kr",
+    "wanted": "https://www.wanted.co.kr",
+    "remember": "https://career.rememberapp.co.kr",
+    "water": "https://watercharging.com",
+}
+
+# (선택) 환경변수
+# - STANDIN_URL     : 로컬 가상 채용 사이트 주소 (예: http://127.0.0.1:8765). 설정 시 모든 사이트를
+#                     STANDIN_URL/<사이트> 로 접속 (standin_server.py, scale_test.py 참고)
+# - CRAWL_COMPANIES : 쉼표로 구분한 검색 대상 기업 (기본값 COMPANIES)
+STANDIN_URL = os.environ.get("STANDIN_URL", "").rstrip("/")
+
+# =========================================================
+# 2. 헬퍼
+# =========================================================
+
+def base_url(site):
+    """사이트의 기본 주소 (가상 사이트 사용 시 STANDIN_URL/<사이트>)"""
+    if STANDIN_URL:
+        return f"{STANDIN_URL}/{site}"
+    return BASE_URLS[site]
+
+def site_url(site, path):
+    """사이트 기본 주소에 경로를 붙입니다. path 는 '/' 로 시작합니다."""
+    return base_url(site) + path
+
+def target_companies():
+    """이번 실행의 검색 대상 기업 목록"""
+    names = os.environ.get("CRAWL_COMPANIES", "")
+    return [n.strip() for n in names.split(",") if n.strip()] or list(COMPANIES)
@@ -0,0 +1,333 @@
+import sys
+import json
+import random
+import argparse
+import threading
+from html import escape
+from urllib.parse import urlparse, parse_qs, quote
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+COMPETITOR_SITES = ["saramin", "wanted", "remember"]
+WATER_COMPANY = "워터(BEP)"
+
+SARAMIN_PAGE_SIZE = 40   # 사람인 검색 결과 1페이지 크기 (recruitPageCount 기본값)
+SARAMIN_NOISE = 3        # 사람인 검색 결과에 섞이는 다른 기업 공고 수
+REMEMBER_BATCH = 20      # 리멤버 무한 스크롤 1회 로드 개수
+
+EXPERIENCES = ["신입", "경력 1~3년", "경력 3~5년", "경력 5년 이상", "경력 7~10년", "경력무관", "신입·경력"]
+JOB_TITLES = ["충전기 HW 개발", "충전 플랫폼 백엔드", "OCPP 펌웨어", "설치 시공 관리", "B2B 영업", "CS 운영", "품질 보증", "데이터 분석"]
+SECTION_TITLES = ["주요업무", "자격요건", "우대사항", "채용절차", "근무지"]
+WATER_SECTIONS = ["채용정보", "주요업무", "지원자격", "우대사항", "채용절차", "근무지"]
+PHRASES = [
+    "전기차 충전 인프라 설계 및 운영", "충전기 펌웨어 개발 및 유지보수", "현장 설치 일정 및 협력사 관리",
+    "관련 분야 경력 3년 이상", "전기기사 자격증 보유자", "OCPP 1.6/2.0.1 이해", "Python 또는 Java 개발 경험",
+    "서류전형 - 1차 면접 - 2차 면접 - 최종합격", "서울 강남구 / 경기 성남시", "고객 VOC 분석 및 개선",
+    "클라우드 기반 서비스 운영 경험", "B2B 영업 및 제안서 작성 경험", "운전면허 1종 보통 이상",
+]
+
+# =========================================================
+# 2. 가상 공고 데이터
+# =========================================================
+
+def company_names(count):
+    """가상 기업명 (자릿수를 고정해 서로 부분 문자열이 되지 않도록 함)"""
+    return [f"가상기업{i:03d}" for i in range(1, count + 1)]
+
+class JobBoard:
+    """네 사이트가 공유하는 가상 공고 목록과 일별 변동(churn)"""
+
+    def __init__(self, companies=7, postings_per_company=10, water_postings=10, churn=0.1, seed=0):
+        self.rng = random.Random(seed)
+        self.companies = company_names(companies)
+        self.churn = churn
+        self.day = 0
+        self.postings = {}   # 공고 번호 -> [site, company, title, experience, open]
+        self.by_company = {}  # (site, company) -> [공고 번호, ...]
+        self.requests = {}   # 사이트별 요청 수
+        self._next_id = 100000
+        self._lock = threading.Lock()
+
+        for site in COMPETITOR_SITES:
+            for company in self.companies:
+                for _ in range(postings_per_company):
+                    self._add(site, company)
+        for _ in range(water_postings):
+            self._add("water", WATER_COMPANY)
+
+    def _add(self, site, company):
+        pid = self._next_id
+        self._next_id += 1
+        title = f"[{company}] {self.rng.choice(JOB_TITLES)} ({pid})"
+        self.postings[pid] = [site, company, title, self.rng.choice(EXPERIENCES), True]
+        self.by_company.setdefault((site, company), []).append(pid)
+        return pid
+
+    def advance(self, days=1):
+        """하루마다 열린 공고의 churn 비율을 마감하고 같은 수의 신규 공고를 같은 기업에 추가합니다."""
+        with self._lock:
+            for _ in range(days):
+                self.day += 1
+                open_ids = [pid for pid, p in self.postings.items() if p[4]]
+                for pid in self.rng.sample(open_ids, int(len(open_ids) * self.churn)):
+                    site, company = self.postings[pid][:2]
+                    self.postings[pid][4] = False
+                    self._add(site, company)
+            return self.stats()
+
+    def open_ids(self, site, company=None):
+        if company is None:
+            return [pid for pid, p in self.postings.items() if p[0] == site and p[4]]
+        return [pid for pid in self.by_company.get((site, company), []) if self.postings[pid][4]]
+
+    def search(self, site, query):
+        """기업명에 검색어가 포함된 열린 공고 번호 목록"""
+        query = (query or "").replace(" ", "")
+        matches = [c for c in self.companies if query and query in c]
+        return [pid for company in matches for pid in self.open_ids(site, company)]
+
+    def get(self, site, pid):
+        """열린 공고만 반환 (마감/없는 공고는 None)"""
+        posting = self.postings.get(pid)
+        if posting and posting[0] == site and posting[4]:
+            return posting
+        return None
+
+    def body(self, pid, sections=SECTION_TITLES):
+        """공고 번호로 결정되는 본문 섹션 [(제목, [줄, ...]), ...] (메모리에 저장하지 않음)"""
+        rng = random.Random(pid)
+        return [(title, rng.sample(PHRASES, rng.randint(3, 5))) for title in sections]
+
+    def count_request(self, site):
+        with self._lock:
+            self.requests[site] = self.requests.get(site, 0) + 1
+
+    def stats(self):
+        total = {site: 0 for site in COMPETITOR_SITES + ["water"]}
+        for p in self.postings.values():
+            if p[4]:
+                total[p[0]] += 1
+        return {"day": self.day, "companies": len(self.companies), "open": total, "requests": dict(self.requests)}
+
+# =========================================================
+# 3. 페이지 렌더링 (스크래퍼가 쓰는 선택자 구조만 흉내냄)
+# =========================================================
+
+def _page(title, body, status=200):
+    html = f"<!DOCTYPE html><html lang='ko'><head><meta charset='utf-8'><title>{escape(title)}</title></head><body>{body}</body></html>"
+    return status, html
+
+def _not_found():
+    return _page("마감된 공고", "<main><h1>마감된 공고입니다</h1><p>채용이 마감되었거나 존재하지 않는 공고입니다.</p></main>", 404)
+
+def _sections_html(sections, heading="h3"):
+    return "".join(
+        f"<div><{heading}>{title}</{heading}><ul>{''.join(f'<li>{escape(line)}</li>' for line in lines)}</ul></div>"
+        for title, lines in sections
+    )
+
+def saramin_search(board, query, page, page_size):
+    ids = board.search("saramin", query)
+    # 실제 사이트처럼 다른 기업 공고가 일부 섞여 나옴 (스크래퍼의 .corp_name 필터 확인용)
+    others = [c for c in board.companies if c != query]
+    for company in others[:SARAMIN_NOISE]:
+        ids.extend(board.open_ids("saramin", company)[:1])
+    items = []
+    for pid in ids[(page - 1) * page_size: page * page_size]:
+        _, company, title, experience, _ = board.postings[pid]
+        items.append(
+            f"<div class='item_recruit'><div class='area_corp'><strong class='corp_name'><a>{company}</a></strong></div>"
+            f"<div class='area_job'><h2 class='job_tit'><a href='/saramin/zf_user/jobs/relay/view?rec_idx={pid}&amp;t_ref=search'>{escape(title)}</a></h2>"
+            f"<div class='job_condition'><span>서울 강남구</span><span>{experience}</span><span>학력무관</span></div></div></div>"
+        )
+    notice = "" if items else "<p class='info_no_result'>검색결과가 없습니다.</p>"
+    return _page(f"{query} 검색 결과", f"<div class='content'>{''.join(items)}{notice}</div><p class='total'>{len(ids)}</p>")
+
+def saramin_view(board, pid):
+    if not board.get("saramin", pid):
+        return _not_found()
+    title = board.postings[pid][2]
+    return _page(title, f"<h1>{escape(title)}</h1><iframe id='iframe_content_0' name='iframe_content_0' src='/saramin/zf_user/jobs/relay/view-detail?rec_idx={pid}'></iframe>")
+
+def saramin_detail(board, pid):
+    if not board.get("saramin", pid):
+        return _not_found()
+    body = _sections_html(board.body(pid)) + f"<img src='/saramin/img/{pid}.png'>"
+    return _page("detail", body)
+
+def wanted_search(board, query):
+    links = "".join(
+        f"<a href='/wanted/wd/{pid}?referer_id=search'><strong>{escape(board.postings[pid][2])}</strong><span>{board.postings[pid][1]}</span></a>"
+        for pid in board.search("wanted", query)
+    )
+    return _page(f"{query} 검색", f"<main>{links or '<p>검색 결과가 없습니다.</p>'}</main>")
+
+def wanted_view(board, pid):
+    posting = board.get("wanted", pid)
+    if not posting:
+        return _not_found()
+    _, company, title, experience, _ = posting
+    header = f"<header><div><div><span>{company}</span><span>서울 · {experience}</span><h1>{escape(title)}</h1></div></div></header>"
+    content = f"<section class='JobContent_description'><div>{_sections_html(board.body(pid))}</div></section>"
+    return _page(title, header + content)
+
+def wanted_api(board, pid):
+    """원티드 공고 API 흉내 (verify_closed 용): 열린 공고 active, 마감 공고 close, 없는 공고 404"""
+    posting = board.postings.get(pid)
+    if not posting or posting[0] != "wanted":
+        return 404, json.dumps({"message": "not found"})
+    return 200, json.dumps({"job": {"id": pid, "status": "active" if posting[4] else "close"}})
+
+REMEMBER_SCRIPT = """
+<script>
+let offset = %d, loading = false;
+window.addEventListener('scroll', async () => {
+  if (loading || window.innerHeight + window.scrollY < document.body.scrollHeight - 50) return;
+  loading = true;
+  const r = await fetch('/remember/job/postings/more?q=%s&offset=' + offset);
+  const html = await r.text();
+  if (html) { document.getElementById('list').insertAdjacentHTML('beforeend', html); offset += %d; }
+  loading = false;
+});
+</script>
+"""
+
+def _remember_cards(board, ids):
+    return "".join(
+        f"<a href='/remember/job/posting/{pid}' style='display:block;min-height:240px'><h3>{escape(board.postings[pid][2])}</h3><p>{board.postings[pid][1]}</p></a>"
+        for pid in ids
+    )
+
+def remember_list(board, query):
+    ids = board.search("remember", query) if query else board.open_ids("remember")[:REMEMBER_BATCH]
+    form = "<form method='get' action='/remember/job/postings'><input type='text' name='q' placeholder='검색어를 입력하세요'></form>"
+    cards = f"<div id='list'>{_remember_cards(board, ids[:REMEMBER_BATCH]) or '<p>검색 결과가 없습니다.</p>'}</div>"
+    script = REMEMBER_SCRIPT % (REMEMBER_BATCH, quote(query or ""), REMEMBER_BATCH) if query else ""
+    return _page("채용공고", form + cards + script)
+
+def remember_more(board, query, offset):
+    ids = board.search("remember", query)
+    return 200, _remember_cards(board, ids[offset: offset + REMEMBER_BATCH])
+
+def remember_view(board, pid):
+    posting = board.get("remember", pid)
+    if not posting:
+        return _not_found()
+    _, company, title, experience, _ = posting
+    return _page(title, f"<h1>{escape(title)}</h1><p>{company} · {experience}</p><article>{_sections_html(board.body(pid), 'strong')}</article>")
+
+def water_list(board):
+    links = "".join(f"<a href='/water/recruitments/{pid}'><span>{escape(board.postings[pid][2])}</span></a>" for pid in board.open_ids("water"))
+    return _page("채용", f"<main>{links}</main>")
+
+def water_view(board, pid):
+    posting = board.get("water", pid)
+    if not posting:
+        return _not_found()
+    return _page(posting[2], f"<main><h1>{escape(posting[2])}</h1>{_sections_html(board.body(pid, WATER_SECTIONS), 'h2')}</main>")
+
+# =========================================================
+# 4. HTTP 서버
+# =========================================================
+
+def _int(value, default=0):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+def route(board, path, query):
+    """경로를 해당 사이트 페이지로 연결합니다. 반환값: (상태 코드, 본문, content-type)"""
+    q = lambda name: query.get(name, [""])[0]
+    last = path.rstrip("/").rsplit("/", 1)[-1]
+
+    if path == "/_standin/stats":
+        return 200, json.dumps(board.stats(), ensure_ascii=False), "application/json"
+    if path == "/_standin/advance":
+        return 200, json.dumps(board.advance(_int(q("days"), 1)), ensure_ascii=False), "application/json"
+
+    site = path.split("/")[1]
+    board.count_request(site)
+    if path == "/saramin/zf_user/search/recruit":
+        status, html = saramin_search(board, q("searchword"), max(1, _int(q("recruitPage"), 1)), _int(q("recruitPageCount"), SARAMIN_PAGE_SIZE))
+    elif path == "/saramin/zf_user/jobs/relay/view":
+        status, html = saramin_view(board, _int(q("rec_idx")))
+    elif path == "/saramin/zf_user/jobs/relay/view-detail":
+        status, html = saramin_detail(board, _int(q("rec_idx")))
+    elif path == "/wanted/search":
+        status, html = wanted_search(board, q("query"))
+    elif path.startswith("/wanted/api/v4/jobs/"):
+        status, body = wanted_api(board, _int(last))
+        return status, body, "application/json"
+    elif path.startswith("/wanted/wd/"):
+        status, html = wanted_view(board, _int(last))
+    elif path == "/remember/job/postings":
+        status, html = remember_list(board, q("q"))
+    elif path == "/remember/job/postings/more":
+        status, html = remember_more(board, q("q"), _int(q("offset")))
+    elif path.startswith("/remember/job/posting/"):
+        status, html = remember_view(board, _int(last))
+    elif path == "/water/recruitments":
+        status, html = water_list(board)
+    elif path.startswith("/water/recruitments/"):
+        status, html = water_view(board, _int(last))
+    elif path.endswith(".png"):
+        return 200, "", "image/png"
+    else:
+        status, html = _not_found()
+    return status, html, "text/html; charset=utf-8"
+
+def make_handler(board, verbose=False):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            u = urlparse(self.path)
+            status, body, content_type = route(board, u.path, parse_qs(u.query))
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            if verbose:
+                super().log_message(format, *args)
+
+    return Handler
+
+def start_server(board, host=DEFAULT_HOST, port=DEFAULT_PORT, verbose=False):
+    """백그라운드 스레드에서 서버를 띄우고 (server, 기본 주소)를 반환합니다. port=0 이면 빈 포트 사용."""
+    server = ThreadingHTTPServer((host, port), make_handler(board, verbose))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스크래퍼 부하 테스트용 가상 채용 사이트 (사람인/원티드/리멤버/워터 구조)")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--companies", type=int, default=7, help="가상 기업 수")
+    parser.add_argument("--postings", type=int, default=10, help="사이트×기업별 공고 수")
+    parser.add_argument("--water-postings", type=int, default=10, help="워터(BEP) 공고 수")
+    parser.add_argument("--churn", type=float, default=0.1, help="하루 마감/신규 비율 (/_standin/advance 호출 시 적용)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+    args = parser.parse_args(argv)
+
+    board = JobBoard(args.companies, args.postings, args.water_postings, args.churn, args.seed)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(board, args.verbose))
+    print(f"[가상 사이트] http://{args.host}:{args.port} 기업 {args.companies}곳 / 공고 {len(board.postings)}건")
+    print(f"    스크래퍼 실행 시: STANDIN_URL=http://{args.host}:{args.port} CRAWL_ALL=1 CRAWL_COMPANIES=...")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,86 @@
+import sys
+import time
+import subprocess
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+# 워크플로에서 실행되는 진입점 모듈
+ENTRY_POINTS = ["scraper", "water_main", "wanted", "remember", "relevance", "notify_new_jobs", "update_data"]
+
+TOP_IMPORTS = 8  # 출력할 상위 import 개수
+
+# =========================================================
+# 2. 측정 함수
+# =========================================================
+
+def import_profile(module):
+    """새 인터프리터에서 모듈을 import 하며 -X importtime 결과를 집계합니다.
+
+    반환값: (전체 기동 시간[초], [(진입점이 직접 import 한 모듈, 누적 시간[초]), ...])
+    """
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - start
+
+    top_level, children = [], []
+    for line in proc.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line.split("|")
+        name = parts[2]
+        try:
+            cumulative = int(parts[1]) / 1e6
+        except ValueError:
+            continue
+        # 자식 모듈이 부모보다 먼저 출력됨: 깊이 1 항목을 모아 두었다가
+        # 깊이 0 항목이 진입점 모듈이면 그 직접 import 목록으로 채택
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            children.append((name.strip(), cumulative))
+        elif depth == 0:
+            if name.strip() == module:
+                top_level = children
+            children = []
+    top_level.sort(key=lambda x: x[1], reverse=True)
+    return wall, top_level
+
+def driver_init_time(options):
+    """chromedriver 경로 결정 + Chrome 기동 시간을 측정합니다."""
+    from driver_setup import resolve_driver_path, create_driver
+
+    start = time.perf_counter()
+    resolve_driver_path()
+    resolved = time.perf_counter() - start
+
+    driver = create_driver(options)
+    launched = time.perf_counter() - start
+    driver.quit()
+    return resolved, launched
+
+def report(module, options=None):
+    """진입점 하나의 시작 비용(import, 드라이버 준비)을 출력합니다."""
+    wall, top_level = import_profile(module)
+    print(f"\n[{module}] import 포함 인터프리터 기동 {wall:.2f}초")
+    for name, seconds in top_level[:TOP_IMPORTS]:
+        print(f"    {name:<32} {seconds * 1000:8.1f}ms")
+
+    if options is not None:
+        try:
+            resolved, launched = driver_init_time(options)
+            print(f"    chromedriver 경로 결정 {resolved:.2f}초 / Chrome 기동까지 {launched:.2f}초")
+        except Exception as e:
+            print(f"    드라이버 초기화 실패: {e}")
+
+def main():
+    """모든 진입점의 import 시간을 측정 (드라이버 측정은 각 스크립트의 --startup-profile 사용)"""
+    for module in ENTRY_POINTS:
+        report(module)
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,158 @@
-import pandas as pd
+import os
+import sys
+import json
+import hashlib
+import argparse
 from datetime import datetime
 
-def update_web_page():
-    # 1. 데이터 로드 (실제 환경에서는 크롤링 코드 삽입 가능)
-    df = pd.read_csv('BEP_EV_Recruitment_Master.csv')
-    
-    # 2. 데이터 가공
-    df['first_seen'] = pd.to_datetime(df['first_seen'])
-    df = df.sort_values(by='first_seen', ascending=True)
-    df['first_seen'] = df['first_seen'].dt.strftime('%Y-%m-%d')
-    df = df.fillna('-')
-
-    # 3. HTML 테이블 생성
-    html_table = df[['공고명', '주요업무', 'first_seen', 'completed_date', '상세URL']].to_html(index=False, classes='table')
-    
-    # 4. index.html 파일 저장
-    with open('index.html', 'w', encoding='utf-8') as f:
-        f.write(f"<html><head><link rel='stylesheet' href='https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css'></head><body>")
-        f.write(f"<div class='container mt-5'><h1>BEP 채용 공고 (업데이트: {datetime.now().strftime('%Y-%m-%d %H:%M')})</h1>")
-        f.write(html_table)
-        f.write("</div></body></html>")
+from postings import SOURCES, load_postings
+from relevance import RELEVANT_SCORE
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+OUTPUT_DIR = "site_data"  # 대시보드(index.html)가 읽는 정적 JSON 페이지
+MANIFEST_FILE = os.path.join(OUTPUT_DIR, "manifest.json")
+PAGE_SIZE = 50
+BUILD_VERSION = 3  # 페이지 형식이 바뀌면 올려서 전체 재생성
+
+# 정렬 보기: 이름 -> (정렬 필드, 내림차순 여부). 완료일 외의 보기에서는 게시중 공고가 마감 공고보다 먼저 옴
+# 완료일 보기는 마감 공고를 완료일 순으로 먼저 보여주고 게시중(완료일 없음) 공고는 뒤로 보냄
+SORTS = {
+    "first_seen_desc": ("first_seen", True),
+    "first_seen_asc": ("first_seen", False),
+    "company_desc": ("company", True),
+    "company_asc": ("company", False),
+    "completed_date_desc": ("completed_date", True),
+    "completed_date_asc": ("completed_date", False),
+}
+
+# 경력 필터 보기 (등록일 내림차순 기준). 대시보드의 경력 선택 상자와 같은 구간
+EXPERIENCE_FILTERS = {
+    "junior": lambda p: p.exp_kind in ("신입", "무관"),
+    "upto3": lambda p: p.exp_min is not None and p.exp_min <= 3,
+    "mid": lambda p: p.exp_min is not None and 3 <= p.exp_min < 7,
+    "senior": lambda p: p.exp_min is not None and p.exp_min >= 7,
+}
+
+# 'BEP 관련 공고만' 보기: 관련도(relevance.py) RELEVANT_SCORE 이상, 관련도 내림차순.
+# 경력 필터와 함께 쓸 수 있도록 경력 구간별로도 만듦 (rel_all, rel_junior, ...)
+
+# 페이지에 싣는 필드 (빈 값은 생략)
+PAGE_FIELDS = (
+    "company", "title", "experience", "first_seen", "completed_date", "url", "body_hash",
+    "exp_kind", "exp_min", "duties", "relevance", "related_role",
+)
+DUTIES_PREVIEW = 50
+
+# =========================================================
+# 2. 페이지 생성
+# =========================================================
+
+def input_hash():
+    """원본 CSV 내용과 페이지 설정으로 만든 해시 (같으면 다시 만들 필요 없음)"""
+    digest = hashlib.sha256(f"{BUILD_VERSION}|{PAGE_SIZE}|{RELEVANT_SCORE}".encode())
+    for site, source in SOURCES.items():
+        digest.update(site.encode())
+        if os.path.exists(source["filename"]):
+            with open(source["filename"], "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+    return digest.hexdigest()
+
+def sort_postings(postings, field, descending):
+    """field 기준 정렬 후 게시중 공고를 앞으로 (안정 정렬 두 번). 완료일 정렬은 게시중 공고를 뒤로"""
+    ordered = sorted(postings, key=lambda p: getattr(p, field) or "", reverse=descending)
+    if field == "completed_date":
+        return sorted(ordered, key=lambda p: p.is_open)
+    return sorted(ordered, key=lambda p: not p.is_open)
+
+def to_row(posting):
+    row = {}
+    for field in PAGE_FIELDS:
+        value = getattr(posting, field)
+        if value in ("", None):
+            continue
+        row[field] = value[:DUTIES_PREVIEW] if field == "duties" else value
+    return row
+
+def write_if_changed(path, data):
+    """내용이 같으면 파일을 건드리지 않습니다 (커밋 diff 최소화). 반환값: 새로 쓴 경우 True"""
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return True
+
+def site_views(postings):
+    """사이트 하나의 보기별 정렬 결과 {보기 이름: [Posting, ...]}"""
+    views = {name: sort_postings(postings, field, desc) for name, (field, desc) in SORTS.items()}
+    for name, matches in EXPERIENCE_FILTERS.items():
+        views[f"exp_{name}"] = [p for p in views["first_seen_desc"] if matches(p)]
+
+    relevant = [p for p in postings if p.relevance is not None and p.relevance >= RELEVANT_SCORE]
+    views["rel_all"] = sorted(sorted(relevant, key=lambda p: p.relevance, reverse=True), key=lambda p: not p.is_open)
+    for name, matches in EXPERIENCE_FILTERS.items():
+        views[f"rel_{name}"] = [p for p in views["rel_all"] if matches(p)]
+    return views
+
+def build_pages(force=False):
+    """입력이 바뀐 경우에만 site_data/<사이트>/<보기>/<페이지>.json 과 manifest.json 을 만듭니다."""
+    digest = input_hash()
+    if not force and os.path.exists(MANIFEST_FILE):
+        with open(MANIFEST_FILE, "r", encoding="utf-8") as f:
+            if json.load(f).get("input_hash") == digest:
+                print("[Skip] 입력 데이터 변경 없음")
+                return False
+
+    by_site = {site: [] for site in SOURCES}
+    for posting in load_postings():
+        by_site[posting.site].append(posting)
+
+    manifest = {"input_hash": digest, "built": datetime.now().strftime("%Y-%m-%d %H:%M"), "page_size": PAGE_SIZE, "relevant_score": RELEVANT_SCORE, "sites": {}}
+    expected, written = set(), 0
+    for site, postings in by_site.items():
+        views = site_views(postings)
+        for view, ordered in views.items():
+            for start in range(0, len(ordered), PAGE_SIZE):
+                path = os.path.join(OUTPUT_DIR, site, view, f"{start // PAGE_SIZE + 1}.json")
+                expected.add(path)
+                written += write_if_changed(path, [to_row(p) for p in ordered[start:start + PAGE_SIZE]])
+        manifest["sites"][site] = {
+            "total": len(postings),
+            "open": sum(p.is_open for p in postings),
+            "views": {view: -(-len(ordered) // PAGE_SIZE) for view, ordered in views.items()},
+        }
+
+    # 데이터가 줄어 더 이상 쓰지 않는 페이지 삭제
+    removed = 0
+    for root, _, files in os.walk(OUTPUT_DIR):
+        for name in files:
+            path = os.path.join(root, name)
+            if path != MANIFEST_FILE and path not in expected:
+                os.remove(path)
+                removed += 1
+
+    write_if_changed(MANIFEST_FILE, manifest)
+    print(f"[페이지 생성] {len(expected)}개 중 {written}개 갱신, {removed}개 삭제")
+    return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드용 정렬·페이지 JSON을 생성합니다 (입력 변경 시에만).")
+    parser.add_argument("--force", action="store_true", help="입력 해시와 무관하게 다시 생성")
+    parser.add_argument("--startup-profile", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.startup_profile:
+        from startup_profile import report
+        report("update_data")
+    else:
+        build_pages(args.force)
 
 if __name__ == "__main__":
-    update_web_page()
+    main(sys.argv[1:])
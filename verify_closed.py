@@ -0,0 +1,223 @@
+import re
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from rate_limiter import RateLimiter, THROTTLED, http_signal
+from sites import BASE_URLS, base_url, site_url
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+# 호스트당 동시 요청 수 / 전체 동시 요청 수 / 요청 타임아웃(초)
+MAX_PER_HOST = 4
+MAX_WORKERS = 16
+TIMEOUT = 10
+
+# 렌더링이 필요한 사이트는 호스트마다 브라우저 여러 개로 나눠 확인 (메모리를 고려해 작게 유지)
+BROWSERS_PER_HOST = 3
+
+# 마감 검증 전용 속도 제한 (수집용 limiter 보다 빠르게 시작, 429 등에서 자동 감속). 검증 브라우저도 이 예산을 씀
+verify_limiter = RateLimiter(host_rates={}, default_rate=4.0, max_rate=10.0, burst=MAX_PER_HOST)
+
+# 마감(삭제)된 공고 페이지에 나타나는 문구
+CLOSED_MARKERS = [
+    "마감된 공고", "마감된 포지션", "채용이 마감", "접수가 마감", "모집이 마감",
+    "마감되었습니다", "종료된 공고", "종료된 채용", "존재하지 않는 공고", "삭제된 공고",
+]
+
+# 마감 문구를 찾을 공고 제목/상태 영역 (메뉴, 추천 공고, 스크립트 속 같은 문구는 무시)
+STATUS_SELECTORS = "title, h1, .info_period, .recruit_status, .status"
+
+# JS 로 렌더링되는 사이트는 HTML 셸에 공고 내용이 없으므로 API 또는 브라우저로 확인
+WANTED_API = "/api/v4/jobs/{id}"        # 원티드 공고 API (job.status: active / close)
+BROWSER_SITES = ("remember", "water")   # 공개 API 가 없어 렌더링 후 확인
+
+# 검증 결과
+CLOSED = "closed"
+OPEN = "open"
+UNKNOWN = "unknown"
+
+# =========================================================
+# 2. 검증 함수
+# =========================================================
+
+def _posting_id(url):
+    """URL에서 공고 번호(가장 긴 숫자열)를 추출합니다."""
+    numbers = re.findall(r"\d+", url)
+    return max(numbers, key=len) if numbers else ""
+
+def _site(url):
+    """URL 이 속한 사이트 이름 (모르는 주소면 None)"""
+    return next((site for site in BASE_URLS if url.startswith(base_url(site) + "/")), None)
+
+def has_closed_marker(text):
+    return any(marker in text for marker in CLOSED_MARKERS)
+
+def status_text(html):
+    """HTML 에서 공고 제목/상태 영역(STATUS_SELECTORS)의 보이는 텍스트만 모읍니다."""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+    return " ".join(node.get_text(" ", strip=True) for node in soup.select(STATUS_SELECTORS))
+
+def _get(session, url):
+    """속도 제한을 지켜 GET 한 응답 (실패하거나 차단 신호면 None)"""
+    verify_limiter.wait(url)
+    try:
+        response = session.get(url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=True)
+    except Exception:
+        return None
+    signal = http_signal(response.status_code, response.text)
+    verify_limiter.report(url, signal)
+    return None if signal == THROTTLED else response
+
+def check_posting(session, url):
+    """서버에서 렌더링되는 상세 URL 하나를 가볍게 조회해 CLOSED / OPEN / UNKNOWN 중 하나를 반환합니다."""
+    response = _get(session, url)
+    if response is None:
+        return UNKNOWN
+
+    if response.status_code in (404, 410):
+        return CLOSED
+    if response.status_code != 200:
+        # 429, 5xx 등은 차단/일시 오류일 수 있으므로 판단 보류
+        return UNKNOWN
+
+    # 공고 번호가 사라진 곳(목록/메인)으로 리다이렉트되면 마감으로 간주
+    posting_id = _posting_id(url)
+    if posting_id and posting_id not in response.url:
+        return CLOSED
+
+    if has_closed_marker(status_text(response.text)):
+        return CLOSED
+    return OPEN
+
+def check_wanted(session, url):
+    """원티드 공고를 공고 API 로 확인합니다 (HTML 셸에는 마감 여부가 없음)."""
+    response = _get(session, site_url("wanted", WANTED_API.format(id=_posting_id(url))))
+    if response is None:
+        return UNKNOWN
+    if response.status_code in (404, 410):
+        return CLOSED
+    if response.status_code != 200:
+        return UNKNOWN
+    try:
+        status = response.json()["job"]["status"]
+    except Exception:
+        return UNKNOWN
+    if status == "active":
+        return OPEN
+    return CLOSED if status in ("close", "closed") else UNKNOWN
+
+def check_in_browser(driver, url):
+    """렌더링이 끝난 페이지의 URL 과 제목/상태 영역으로 마감 여부를 판단합니다."""
+    from selenium.webdriver.common.by import By
+    from rate_limiter import browser_get
+
+    try:
+        signal = browser_get(driver, url, ready=(By.TAG_NAME, "h1"), empty_signal=False, limiter=verify_limiter)
+        if signal == THROTTLED:
+            return UNKNOWN
+        posting_id = _posting_id(url)
+        if posting_id and posting_id not in driver.current_url:
+            return CLOSED
+        headings = driver.find_elements(By.CSS_SELECTOR, STATUS_SELECTORS)
+        if has_closed_marker(driver.title + " " + " ".join(h.text for h in headings)):
+            return CLOSED
+        return OPEN if driver.find_elements(By.TAG_NAME, "h1") else UNKNOWN
+    except Exception:
+        return UNKNOWN
+
+def _browser_options():
+    from selenium.webdriver.chrome.options import Options
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument(f"user-agent={HEADERS['User-Agent']}")
+    # 마감 여부는 제목/상태 영역만 보면 되므로 이미지와 하위 리소스 로딩을 기다리지 않음
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.page_load_strategy = "eager"
+    return options
+
+def _browse(pending, results):
+    """브라우저 하나를 띄워 pending(같은 호스트의 공유 deque)이 빌 때까지 확인합니다. 반환값: 시작 실패 사유"""
+    from driver_setup import create_driver
+
+    try:
+        driver = create_driver(_browser_options())
+    except Exception as e:
+        return str(e).splitlines()[0] if str(e) else repr(e)
+    try:
+        while True:
+            try:
+                url = pending.popleft()
+            except IndexError:
+                return None
+            results[url] = check_in_browser(driver, url)
+    finally:
+        driver.quit()
+
+def check_with_browser(urls, per_host=BROWSERS_PER_HOST):
+    """호스트마다 브라우저 per_host 개가 URL 을 나눠 동시에 확인합니다 (속도는 호스트별 verify_limiter 가 제한).
+
+    브라우저를 하나도 띄우지 못한 호스트의 URL 은 판단 보류.
+    """
+    if not urls:
+        return {}
+
+    by_host = defaultdict(deque)
+    for url in urls:
+        by_host[urlparse(url).netloc].append(url)
+    jobs = [pending for pending in by_host.values() for _ in range(min(per_host, len(pending)))]
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        errors = [e for e in executor.map(lambda pending: _browse(pending, results), jobs) if e]
+    if errors:
+        print(f"[마감 검증] 브라우저 {len(errors)}/{len(jobs)}개 시작 실패: {errors[0]}")
+    results.update({url: UNKNOWN for url in urls if url not in results})
+    return results
+
+def confirm_closed(urls, max_per_host=MAX_PER_HOST, max_workers=MAX_WORKERS):
+    """마감 후보 URL들을 동시에 검증하고 마감이 확인된 URL 집합을 반환합니다."""
+    urls = [u for u in dict.fromkeys(urls) if isinstance(u, str) and u]
+    if not urls:
+        return set()
+
+    host_limits = defaultdict(lambda: threading.Semaphore(max_per_host))
+    for url in urls:
+        host_limits[urlparse(url).netloc]
+
+    # requests 는 실제 검증할 후보가 있을 때만 import
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=len(host_limits), pool_maxsize=max_per_host)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    def _check(url):
+        with host_limits[urlparse(url).netloc]:
+            check = check_wanted if _site(url) == "wanted" else check_posting
+            return url, check(session, url)
+
+    # 서버 렌더링/API 로 확인할 수 있는 URL 은 HTTP 로, 나머지는 호스트별 브라우저 여러 개로 동시에
+    in_browser = [url for url in urls if _site(url) in BROWSER_SITES]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = dict(executor.map(_check, [url for url in urls if _site(url) not in BROWSER_SITES]))
+    session.close()
+    results.update(check_with_browser(in_browser))
+
+    closed = {url for url, status in results.items() if status == CLOSED}
+    unknown = sum(1 for status in results.values() if status == UNKNOWN)
+    print(f"[마감 검증] 후보 {len(urls)}건 → 마감 확인 {len(closed)}건 / 게시중 {len(urls) - len(closed) - unknown}건 / 판단 보류 {unknown}건")
+    return closed
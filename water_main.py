@@ -1,16 +1,32 @@
 import time
 import os
+import sys
 import re
 import pandas as pd
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from parse_pipeline import ParsePipeline, parse_detail
+from experience import add_experience_columns
+from driver_setup import create_driver
+from verify_closed import confirm_closed
+from analytics import record_run
+from rate_limiter import browser_get
+from sites import site_url
+
+def build_options():
+    """Chrome 실행 옵션"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")
+    return chrome_options
 
 def scrape_water_recruitment():
     file_name = "BEP_EV_Recruitment_Master.csv"
@@ -30,26 +46,16 @@ def scrape_water_recruitment():
         df_master = pd.DataFrame(columns=["공고명", "부문", "채용정보", "주요업무", "지원자격", "우대사항", "채용절차", "근무지", "상세URL", "first_seen", "completed_date"])
 
     # 2. 브라우저 설정 (우회 설정 강화)
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")
-    
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+    driver = create_driver(build_options())
     # webdriver 속성 제거 (우회)
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     
-    url = "https://watercharging.com/recruitments"
+    url = site_url("water", "/recruitments")
     print(f"사이트 접속 중: {url}")
     
     current_jobs = []
     try:
-        driver.get(url)
-        time.sleep(5) # 초기 로딩 대기
+        browser_get(driver, url, ready=(By.CSS_SELECTOR, "a[href*='/recruitments/']")) # 초기 로딩 대기 (속도 제한 포함)
 
         # 여러 번 스크롤하여 동적 컨텐츠 로드 유도
         for _ in range(3):
@@ -89,50 +95,42 @@ def scrape_water_recruitment():
         driver.quit()
         return
 
-    # 3. 상세 정보 수집 (기존 로직 유지)
+    # 3. 상세 정보 수집
+    # 브라우저는 페이지를 열어 page_source 만 넘기고, 파싱(본문 추출 + 섹션 분리)은 프로세스 풀에서 동시에 진행
     scraped_urls = [job['URL'] for job in current_jobs]
     new_results = []
 
-    for job in current_jobs:
-        if job['URL'] in df_master['상세URL'].values:
-            df_master.loc[df_master['상세URL'] == job['URL'], 'completed_date'] = ""
-            continue
-            
-        print(f"신규 수집: {job['공고명']}")
-        try:
-            driver.get(job['URL'])
-            time.sleep(3)
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # 본문 추출 로직
-            content = soup.find('main') or soup.find('body')
-            lines = content.get_text(separator="\n", strip=True).split('\n')
-            
+    with ParsePipeline(parse_detail) as pipeline:
+        for job in current_jobs:
+            if job['URL'] in df_master['상세URL'].values:
+                df_master.loc[df_master['상세URL'] == job['URL'], 'completed_date'] = ""
+                continue
+
+            print(f"신규 수집: {job['공고명']}")
+            try:
+                browser_get(driver, job['URL'], ready=(By.CSS_SELECTOR, "main, h1"), empty_signal=False)
+                pipeline.submit(job, driver.page_source)
+            except Exception as e:
+                print(f"상세 페이지 수집 실패 ({job['URL']}): {e}")
+
+        for job, sections, error in pipeline.results():
+            if error:
+                print(f"상세 페이지 파싱 실패 ({job['URL']}): {error}")
+                continue
             data = {
                 "공고명": job['공고명'], "부문": "WATER", "상세URL": job['URL'],
                 "채용정보": "", "주요업무": "", "지원자격": "", "우대사항": "", 
                 "채용절차": "", "근무지": "", "first_seen": today, "completed_date": ""
             }
-            
-            curr = None
-            for line in lines:
-                line = line.strip()
-                if not line: continue
-                if any(k in line for k in ["주요 업무", "주요업무", "무슨 일을"]): curr = "주요업무"
-                elif any(k in line for k in ["지원 자격", "자격 요건", "찾습니다"]): curr = "지원자격"
-                elif any(k in line for k in ["우대 사항", "더 좋습니다"]): curr = "우대사항"
-                elif any(k in line for k in ["채용 절차", "전형 절차"]): curr = "채용절차"
-                elif "근무지" in line: curr = "근무지"
-                elif any(k in line for k in ["복지", "혜택", "지원하기"]): curr = None
-                elif curr: data[curr] += line + "\n"
-            
+            # 섹션 분리 결과 (공용 섹션 파서)
+            data.update(sections)
             new_results.append(data)
-        except Exception as e:
-            print(f"상세 페이지 수집 실패 ({job['URL']}): {e}")
 
     # 4. 마감 처리 및 저장
     active_mask = df_master['completed_date'].isna() | (df_master['completed_date'] == "")
     closed_jobs_mask = active_mask & (~df_master['상세URL'].isin(scraped_urls))
+    # 목록에서 빠진 공고는 상세 페이지로 마감 여부를 확인한 뒤에만 마감 처리
+    closed_jobs_mask &= df_master['상세URL'].isin(confirm_closed(df_master.loc[closed_jobs_mask, '상세URL']))
     df_master.loc[closed_jobs_mask, 'completed_date'] = today
 
     if new_results:
@@ -140,9 +138,16 @@ def scrape_water_recruitment():
     else:
         df_final = df_master
 
+    # 경력 숫자 컬럼 갱신 (지원자격 본문 기준)
+    df_final = add_experience_columns(df_final, "지원자격")
     df_final.to_csv(file_name, index=False, encoding="utf-8-sig")
+    record_run("bep", df_final)
     print(f"\n[업데이트 완료] 신규 {len(new_results)}건 / 마감 {closed_jobs_mask.sum()}건")
     driver.quit()
 
 if __name__ == "__main__":
-    scrape_water_recruitment()
+    if "--startup-profile" in sys.argv:
+        from startup_profile import report
+        report("water_main", build_options())
+    else:
+        scrape_water_recruitment()
@@ -0,0 +1,136 @@
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+from collections import defaultdict
+
+# =========================================================
+# 1. 설정
+# =========================================================
+
+# WEBDRIVER_TRACE=trace.json 으로 켬 (driver_setup.create_driver 가 만든 모든 드라이버에 적용)
+# 프로세스마다 파일 이름에 PID 를 붙여 따로 저장 (crawl_queue 워커 여러 개가 서로 덮어쓰지 않도록)
+# - trace.<pid>.json   : Chrome trace 형식 (chrome://tracing, ui.perfetto.dev, speedscope 에서 타임라인으로 보기)
+# - trace.<pid>.folded : 접힌 스택 형식 (speedscope, flamegraph.pl 로 플레임 그래프 보기)
+TRACE_FILE = os.environ.get("WEBDRIVER_TRACE", "")
+
+STACK_DEPTH = 3   # 호출 위치로 기록할 프로젝트 코드 프레임 수 (안쪽부터)
+TOP_SITES = 15    # 요약에 출력할 상위 호출 위치 수
+
+# 호출 위치에서 제외할 코드 (selenium 내부, 이 모듈)
+_SKIP_PATHS = (os.sep + "selenium" + os.sep, os.path.abspath(__file__))
+
+# =========================================================
+# 2. 추적기
+# =========================================================
+
+def _size(value):
+    """명령 인자/응답의 JSON 크기(byte)"""
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+    except Exception:
+        return 0
+
+class CommandTracer:
+    """WebDriver 명령마다 (호출 위치, 소요 시간, 주고받은 크기)를 기록합니다."""
+
+    def __init__(self, path):
+        self.path = path
+        self.origin = time.perf_counter()
+        self.events = []
+        # (호출 위치, 명령) -> [횟수, 총 시간, 최대 시간, 보낸 byte, 받은 byte]
+        self.stats = defaultdict(lambda: [0, 0.0, 0.0, 0, 0])
+        self._lock = threading.Lock()
+        atexit.register(self.finish)
+
+    def call_site(self):
+        """이 명령을 부른 프로젝트 코드 위치 (바깥 → 안쪽, 최대 STACK_DEPTH 프레임)"""
+        frames = []
+        frame = sys._getframe(2)
+        while frame and len(frames) < STACK_DEPTH:
+            filename = frame.f_code.co_filename
+            if not any(skip in filename for skip in _SKIP_PATHS):
+                frames.append(f"{os.path.basename(filename)}:{frame.f_lineno}({frame.f_code.co_name})")
+            frame = frame.f_back
+        return " > ".join(reversed(frames)) or "?"
+
+    def wrap(self, driver):
+        """드라이버 인스턴스의 execute 를 감쌉니다 (WebElement 명령도 모두 이 경로를 지남)."""
+        original = driver.execute
+
+        def execute(driver_command, params=None):
+            site = self.call_site()
+            start = time.perf_counter()
+            response = None
+            try:
+                response = original(driver_command, params)
+                return response
+            finally:
+                self.record(driver_command, site, start, time.perf_counter() - start, params, response)
+
+        driver.execute = execute
+        return driver
+
+    def record(self, command, site, start, elapsed, params, response):
+        sent = _size(params) if params else 0
+        received = _size(response.get("value")) if isinstance(response, dict) else 0
+        with self._lock:
+            stat = self.stats[(site, command)]
+            stat[0] += 1
+            stat[1] += elapsed
+            stat[2] = max(stat[2], elapsed)
+            stat[3] += sent
+            stat[4] += received
+            self.events.append({
+                "name": command, "cat": "webdriver", "ph": "X",
+                "ts": round((start - self.origin) * 1e6), "dur": round(elapsed * 1e6),
+                "pid": os.getpid(), "tid": threading.get_ident() % 100000,
+                "args": {"site": site, "sent": sent, "received": received},
+            })
+
+    def summary(self):
+        """상위 호출 위치를 총 시간 순, 호출 횟수 순으로 출력합니다."""
+        rows = [(site, command, *stat) for (site, command), stat in self.stats.items()]
+        total = sum(r[3] for r in rows)
+        print(f"\n[WebDriver 추적] 명령 {sum(r[2] for r in rows)}회, 총 {total:.1f}초")
+        for title, key in (("총 시간 순", lambda r: r[3]), ("호출 횟수 순", lambda r: r[2])):
+            print(f"  -- {title} --")
+            for site, command, count, seconds, longest, sent, received in sorted(rows, key=key, reverse=True)[:TOP_SITES]:
+                print(
+                    f"  {seconds:8.2f}초 {count:6d}회 평균 {seconds / count * 1000:7.1f}ms 최대 {longest * 1000:7.1f}ms "
+                    f"수신 {received / 1024:8.1f}KB  {command:<24} {site}"
+                )
+
+    def finish(self):
+        if not self.events:
+            return
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+
+        # 플레임 그래프용: 호출 스택;명령 → 총 시간(µs)
+        folded = defaultdict(int)
+        for event in self.events:
+            folded[event["args"]["site"].replace(" > ", ";") + ";" + event["name"]] += event["dur"]
+        with open(os.path.splitext(self.path)[0] + ".folded", "w", encoding="utf-8") as f:
+            f.writelines(f"{stack} {us}\n" for stack, us in folded.items())
+
+        self.summary()
+        print(f"  추적 파일: {self.path}")
+
+_tracer = None
+
+def process_trace_path(path, pid=None):
+    """trace.json → trace.<pid>.json"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.{pid or os.getpid()}{ext or '.json'}"
+
+def trace_driver(driver):
+    """WEBDRIVER_TRACE 가 설정된 경우에만 드라이버를 추적합니다 (프로세스당 추적기 하나)."""
+    global _tracer
+    if not TRACE_FILE:
+        return driver
+    if _tracer is None:
+        _tracer = CommandTracer(process_trace_path(TRACE_FILE))
+    return _tracer.wrap(driver)